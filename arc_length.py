@@ -0,0 +1,64 @@
+from manim import *
+import numpy as np
+
+LENGTH_SAMPLES = 10
+_SAMPLE_T = np.linspace(0, 1, LENGTH_SAMPLES)
+_SAMPLE_BASIS = np.stack([(1 - _SAMPLE_T)**3, 3 * (1 - _SAMPLE_T)**2 * _SAMPLE_T, 3 * (1 - _SAMPLE_T) * _SAMPLE_T**2, _SAMPLE_T**3], axis=1)
+
+def _bezier_basis(t):
+    return np.stack([(1 - t)**3, 3 * (1 - t)**2 * t, 3 * (1 - t) * t**2, t**3], axis=-1)
+
+def arc_length_table(vmobject):
+    """Cumulative curve lengths of ``vmobject``, measured the way manim does
+    (ten chord samples per cubic) but for all curves in one einsum. Cached on
+    the mobject against its ``points`` array and dropped by
+    ``apply_points_function_about_point``, which can stretch that array in
+    place; the remaining in-place writes (shifts, rigid buffers) are
+    similarities, which leave length proportions unchanged."""
+    points = vmobject.points
+    cached = getattr(vmobject, "_arc_length_table", None)
+    if cached is not None and cached[0] is points and cached[1] == points.shape:
+        return cached[2]
+    curves = points[:len(points) // 4 * 4].reshape(-1, 4, 3)
+    samples = np.einsum("sk,ckd->csd", _SAMPLE_BASIS, curves)
+    lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+    table = np.cumsum(lengths)
+    vmobject._arc_length_table = (points, points.shape, table)
+    return table
+
+def points_from_proportions(vmobject, alphas):
+    """Vectorized :meth:`VMobject.point_from_proportion`: a binary search in the
+    arc-length table per alpha instead of a walk over every curve."""
+    alphas = np.asarray(alphas, dtype=np.float64)
+    if np.any((alphas < 0) | (alphas > 1)):
+        raise ValueError(f"Alpha {alphas} not between 0 and 1.")
+    vmobject.throw_error_if_no_points()
+    table = arc_length_table(vmobject)
+    targets = alphas * table[-1]
+    index = np.minimum(np.searchsorted(table, targets), len(table) - 1)
+    previous = np.where(index > 0, table[index - 1], 0.0)
+    lengths = table[index] - previous
+    residue = np.divide(targets - previous, lengths, out=np.zeros_like(targets), where=lengths != 0)
+    curves = vmobject.points[:len(table) * 4].reshape(-1, 4, 3)[index]
+    result = np.einsum("...k,...kd->...d", _bezier_basis(residue), curves)
+    return np.where((alphas == 1)[..., None], vmobject.points[-1], result)
+
+def point_from_proportion(self, alpha):
+    return points_from_proportions(self, alpha)
+
+_original_apply_points_function = None
+
+def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+    result = _original_apply_points_function(self, func, about_point, about_edge)
+    for mob in self.family_members_with_points():
+        mob.__dict__.pop("_arc_length_table", None)
+    return result
+
+def install():
+    """Make ``VMobject.point_from_proportion`` (and so ``MoveAlongPath``) use the
+    cached arc-length table, and invalidate it on every point transform."""
+    global _original_apply_points_function
+    VMobject.point_from_proportion = point_from_proportion
+    if _original_apply_points_function is None:
+        _original_apply_points_function = Mobject.apply_points_function_about_point
+        Mobject.apply_points_function_about_point = apply_points_function_about_point
@@ -0,0 +1,281 @@
+import os
+import re
+import string
+
+from manim import *
+import numpy as np
+
+ATLAS_PATH = os.path.join("media", "atlas", "cm_glyphs.npz")
+ATLAS_CHUNK = 24
+CALIBRATION_RULE = r"\vrule width 0.02em height 1.5em depth 0pt"
+SCRIPT_SCALE = 0.7
+SUP_SHIFT, SUP_DROP, SUB_SHIFT, SUB_SHIFT_WITH_SUP, SCRIPT_SPACE = 0.413, 0.27, 0.15, 0.247, 0.05
+TEXT_SPACE = 1 / 3
+
+MATH_SYMBOLS = {
+    **{c: (c, "ord") for c in string.digits + string.ascii_letters + "|/.'"},
+    "+": ("+", "bin"), "-": ("-", "bin"), "=": ("=", "rel"), "<": ("<", "rel"), ">": (">", "rel"), ":": (":", "rel"),
+    "(": ("(", "open"), "[": ("[", "open"), ")": (")", "close"), "]": ("]", "close"), "!": ("!", "close"), ",": (",", "punct"),
+    r"\approx": (r"\approx", "rel"), r"\equiv": (r"\equiv", "rel"), r"\neq": (r"\neq", "rel"), r"\cdot": (r"\cdot", "bin"),
+    r"\times": (r"\times", "bin"), r"\pm": (r"\pm", "bin"), r"\langle": (r"\langle", "open"), r"\rangle": (r"\rangle", "close"),
+    r"\pi": (r"\pi", "ord"), r"\infty": (r"\infty", "ord"), r"\ldots": (r"\ldots", "inner"),
+}
+TEXT_CHARS = string.ascii_letters + string.digits + ".,:;!?'()-/%"
+OPERATOR_NAMES = {r"\gcd": "gcd", r"\log": "log", r"\exp": "exp", r"\max": "max", r"\min": "min", r"\sin": "sin", r"\cos": "cos"}
+MATH_SPACES = {r"\,": 3, r"\:": 4, r"\;": 5, r"\ ": 6, r"\quad": 18, r"\qquad": 36, r"\!": -3}
+INTER_ATOM_MU = {
+    ("ord", "op"): 3, ("ord", "bin"): 4, ("ord", "rel"): 5, ("ord", "inner"): 3,
+    ("op", "ord"): 3, ("op", "op"): 3, ("op", "rel"): 5, ("op", "inner"): 3,
+    ("bin", "ord"): 4, ("bin", "op"): 4, ("bin", "open"): 4, ("bin", "inner"): 4,
+    ("rel", "ord"): 5, ("rel", "op"): 5, ("rel", "open"): 5, ("rel", "inner"): 5,
+    ("close", "op"): 3, ("close", "bin"): 4, ("close", "rel"): 5, ("close", "inner"): 3,
+    ("punct", "ord"): 3, ("punct", "op"): 3, ("punct", "rel"): 3, ("punct", "open"): 3, ("punct", "close"): 3,
+    ("punct", "punct"): 3, ("punct", "inner"): 3,
+    ("inner", "ord"): 3, ("inner", "op"): 3, ("inner", "bin"): 4, ("inner", "rel"): 5, ("inner", "open"): 3,
+    ("inner", "punct"): 3, ("inner", "inner"): 3,
+}
+TOKEN_PATTERN = re.compile(r"\\[a-zA-Z]+|\\.|\s+|.")
+
+class UnsupportedTex(ValueError):
+    pass
+
+def atlas_glyph_specs():
+    specs = [(key, key) for key, _ in MATH_SYMBOLS.values()]
+    specs += [(f"text:{c}", r"\text{%s}" % ("\\%" if c == "%" else c)) for c in TEXT_CHARS]
+    return list(dict.fromkeys(specs))
+
+def build_atlas(path=ATLAS_PATH):
+    """Typeset every atlas glyph once with LaTeX between calibration rules and
+    store its outline, advance and vertical extent in em units."""
+    keys, advances, extents, offsets, points = [], [], [], [0], []
+    specs = atlas_glyph_specs()
+    for start in range(0, len(specs), ATLAS_CHUNK):
+        chunk = specs[start:start + ATLAS_CHUNK]
+        line = SingleStringMathTex(CALIBRATION_RULE + "".join("{%s}%s" % (tex, CALIBRATION_RULE) for _, tex in chunk))
+        paths = line.family_members_with_points()
+        rule_height = max(p.height for p in paths)
+        rules = sorted((p for p in paths if p.height > 0.97 * rule_height), key=lambda p: p.get_x())
+        if len(rules) != len(chunk) + 1:
+            raise RuntimeError("could not locate the atlas calibration rules")
+        em, baseline = rule_height / 1.5, rules[0].get_bottom()[1]
+        for (key, _), left_rule, right_rule in zip(chunk, rules, rules[1:]):
+            left, right = left_rule.get_right()[0], right_rule.get_left()[0]
+            glyph = [p.points for p in paths if p not in rules and left < p.get_x() < right]
+            glyph_points = (np.concatenate(glyph) - np.array([left, baseline, 0])) / em if glyph else np.zeros((0, 3))
+            keys.append(key)
+            advances.append((right - left) / em)
+            extents.append((glyph_points[:, 1].max(), glyph_points[:, 1].min()) if len(glyph_points) else (0.0, 0.0))
+            points.append(glyph_points)
+            offsets.append(offsets[-1] + len(glyph_points))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez(
+        path, keys=np.array(keys), advances=np.array(advances), extents=np.array(extents).reshape(-1, 2),
+        offsets=np.array(offsets), points=np.concatenate(points), em=np.array(em),
+    )
+
+_atlas = None
+_build_failed = False
+
+def load_atlas(path=ATLAS_PATH):
+    """Glyph table ``key -> (points, advance, top, bottom)`` plus the em size at
+    the default font size, or ``None`` while it is unavailable. A missing atlas
+    is built once per process (``python atlas_math.py`` builds it up front);
+    only a successful load is cached, so an atlas built later is picked up."""
+    global _atlas, _build_failed
+    if _atlas is None:
+        if not os.path.exists(path):
+            if _build_failed:
+                return None
+            try:
+                build_atlas(path)
+            except Exception:
+                _build_failed = True
+                return None
+        try:
+            with np.load(path) as data:
+                offsets = data["offsets"]
+                glyphs = {
+                    str(key): (data["points"][offsets[i]:offsets[i + 1]], advance, top, bottom)
+                    for i, (key, advance, (top, bottom)) in enumerate(zip(data["keys"], data["advances"], data["extents"]))
+                }
+                _atlas = (glyphs, float(data["em"]))
+        except Exception:
+            return None
+    return _atlas
+
+class _Box:
+    def __init__(self, items=(), width=0.0):
+        self.items, self.width = list(items), width
+
+    def extent(self, glyphs):
+        if not self.items:
+            return 0.0, 0.0
+        return (max(y + glyphs[key][2] * s for _, key, _, y, s in self.items),
+                min(y + glyphs[key][3] * s for _, key, _, y, s in self.items))
+
+    def place(self, box, dx, dy):
+        self.items += [(tag, key, x + dx, y + dy, s) for tag, key, x, y, s in box.items]
+
+class _Atom:
+    def __init__(self, cls, box, kern=0.0):
+        self.cls, self.box, self.kern, self.sup, self.sub = cls, box, kern, None, None
+
+class _Layout:
+    """Subset of TeX math layout: atoms with TeX inter-atom spacing, scripts,
+    groups, ``\\text``, operator names and ``\\pmod``."""
+    def __init__(self, glyphs, tag):
+        self.glyphs, self.tag = glyphs, tag
+
+    def glyph(self, key, scale):
+        if key not in self.glyphs:
+            raise UnsupportedTex(key)
+        return _Box([(self.tag, key, 0.0, 0.0, scale)], self.glyphs[key][1] * scale)
+
+    def text(self, text, scale):
+        box = _Box()
+        for char in re.sub(r"\s+", " ", text):
+            if char == " ":
+                box.width += TEXT_SPACE * scale
+                continue
+            glyph = self.glyph(f"text:{char}", scale)
+            box.place(glyph, box.width, 0)
+            box.width += glyph.width
+        return box
+
+    def group_tokens(self, tokens, pos):
+        depth, start = 1, pos
+        while pos < len(tokens):
+            depth += {"{": 1, "}": -1}.get(tokens[pos], 0)
+            if depth == 0:
+                return tokens[start:pos], pos + 1
+            pos += 1
+        raise UnsupportedTex("unbalanced braces")
+
+    def argument(self, tokens, pos):
+        while pos < len(tokens) and tokens[pos].isspace():
+            pos += 1
+        if pos == len(tokens):
+            raise UnsupportedTex("missing argument")
+        if tokens[pos] == "{":
+            return self.group_tokens(tokens, pos + 1)
+        return [tokens[pos]], pos + 1
+
+    def atoms(self, tokens, scale):
+        atoms, pos = [], 0
+        while pos < len(tokens):
+            token = tokens[pos]
+            pos += 1
+            if token.isspace():
+                continue
+            if token in ("^", "_"):
+                arg, pos = self.argument(tokens, pos)
+                if not atoms or atoms[-1].cls == "kern":
+                    atoms.append(_Atom("ord", _Box()))
+                slot = "sup" if token == "^" else "sub"
+                if getattr(atoms[-1], slot) is not None:
+                    raise UnsupportedTex("double script")
+                setattr(atoms[-1], slot, self.hlist(self.atoms(arg, scale * SCRIPT_SCALE), scale * SCRIPT_SCALE))
+            elif token == "{":
+                group, pos = self.group_tokens(tokens, pos)
+                atoms.append(_Atom("ord", self.hlist(self.atoms(group, scale), scale)))
+            elif token == r"\text":
+                group, pos = self.argument(tokens, pos)
+                text = "".join(t[1:] if t in (r"\%", r"\ ") else t for t in group)
+                if "\\" in text or "{" in text:
+                    raise UnsupportedTex(text)
+                atoms.append(_Atom("ord", self.text(text, scale)))
+            elif token == r"\pmod":
+                group, pos = self.argument(tokens, pos)
+                atoms += [
+                    _Atom("kern", _Box(), 8 / 18 * scale), _Atom("open", self.glyph("(", scale)),
+                    _Atom("ord", self.text("mod", scale)), _Atom("kern", _Box(), 6 / 18 * scale),
+                    _Atom("ord", self.hlist(self.atoms(group, scale), scale)), _Atom("close", self.glyph(")", scale)),
+                ]
+            elif token == r"\bmod":
+                atoms.append(_Atom("bin", self.text("mod", scale)))
+            elif token in OPERATOR_NAMES:
+                atoms.append(_Atom("op", self.text(OPERATOR_NAMES[token], scale)))
+            elif token in MATH_SPACES:
+                atoms.append(_Atom("kern", _Box(), MATH_SPACES[token] / 18 * scale))
+            elif token in MATH_SYMBOLS:
+                key, cls = MATH_SYMBOLS[token]
+                atoms.append(_Atom(cls, self.glyph(key, scale)))
+            else:
+                raise UnsupportedTex(token)
+        return atoms
+
+    def hlist(self, atoms, scale):
+        classes = [a.cls for a in atoms if a.cls != "kern"]
+        for index, cls in enumerate(classes):
+            before = classes[index - 1] if index else None
+            after = classes[index + 1] if index + 1 < len(classes) else None
+            if cls == "bin" and (before in (None, "bin", "op", "rel", "open", "punct") or after in (None, "rel", "close", "punct")):
+                classes[index] = "ord"
+        box, previous, index = _Box(), None, 0
+        for atom in atoms:
+            if atom.cls == "kern":
+                box.width += atom.kern
+                continue
+            cls, index = classes[index], index + 1
+            if previous is not None:
+                space = INTER_ATOM_MU.get((previous, cls), 0)
+                if scale >= 1 or "op" in (previous, cls):
+                    box.width += space / 18 * scale
+            previous = cls
+            box.place(atom.box, box.width, 0)
+            nucleus_top, nucleus_bottom = atom.box.extent(self.glyphs)
+            script_width = 0.0
+            if atom.sup is not None:
+                box.place(atom.sup, box.width + atom.box.width, max(SUP_SHIFT * scale, nucleus_top - SUP_DROP * scale))
+                script_width = atom.sup.width
+            if atom.sub is not None:
+                shift = (SUB_SHIFT_WITH_SUP if atom.sup is not None else SUB_SHIFT) * scale
+                box.place(atom.sub, box.width + atom.box.width, -max(shift, -nucleus_bottom))
+                script_width = max(script_width, atom.sub.width)
+            box.width += atom.box.width + (script_width + SCRIPT_SPACE * scale if script_width else 0)
+        return box
+
+def layout_math(tex_strings, glyphs):
+    """Glyph placements ``(string index, key, x, y, scale)`` in em units for the
+    concatenation of ``tex_strings``, as ``MathTex`` would join them."""
+    atoms = []
+    for tag, tex in enumerate(tex_strings):
+        atoms += _Layout(glyphs, tag).atoms(TOKEN_PATTERN.findall(tex), 1.0)
+    return _Layout(glyphs, None).hlist(atoms, 1.0).items
+
+class AtlasMathTex(VGroup):
+    """Drop-in for simple ``MathTex``: one ``VGroup`` of glyph outlines per tex
+    string, laid out from the Computer Modern atlas without running LaTeX."""
+    def __init__(self, *tex_strings, font_size=DEFAULT_FONT_SIZE, color=WHITE, **kwargs):
+        atlas = load_atlas()
+        if atlas is None:
+            raise UnsupportedTex("glyph atlas unavailable")
+        glyphs, em = atlas
+        items = layout_math(tex_strings, glyphs)
+        super().__init__(**kwargs)
+        self.tex_strings = list(tex_strings)
+        self.tex_string = " ".join(tex_strings)
+        unit = em * font_size / DEFAULT_FONT_SIZE
+        parts = [VGroup() for _ in tex_strings]
+        for tag, key, x, y, s in items:
+            if len(glyphs[key][0]):
+                glyph = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+                glyph.set_points(glyphs[key][0] * (unit * s) + np.array([x, y, 0]) * unit)
+                parts[tag].add(glyph)
+        self.add(*parts)
+        self.center()
+
+def math_tex(*tex_strings, **kwargs):
+    """``AtlasMathTex`` when the input is within the supported subset and only
+    ``font_size``/``color`` are given, real ``MathTex`` otherwise."""
+    if set(kwargs) <= {"font_size", "color"}:
+        try:
+            return AtlasMathTex(*tex_strings, **kwargs)
+        except UnsupportedTex:
+            pass
+    return MathTex(*tex_strings, **kwargs)
+
+if __name__ == "__main__":
+    build_atlas()
+    glyphs, em = load_atlas()
+    print(f"{len(glyphs)} glyphs written to {ATLAS_PATH}")
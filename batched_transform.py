@@ -0,0 +1,61 @@
+from manim import *
+import numpy as np
+
+def _rotation_matrices(angles, axes):
+    axes = axes / np.linalg.norm(axes, axis=-1, keepdims=True)
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    zero = np.zeros_like(x)
+    cross = np.stack([zero, -z, y, z, zero, -x, -y, x, zero], axis=-1).reshape(-1, 3, 3)
+    sin, cos = np.sin(angles)[:, None, None], np.cos(angles)[:, None, None]
+    return np.eye(3) + sin * cross + (1 - cos) * (cross @ cross)
+
+class BatchedRigidTransform(Animation):
+    """Rotate, scale and shift every submobject of ``group`` about its own
+    centre, each by its own amount.
+
+    Per-member parameters are arrays; on ``begin`` the points of all members
+    are concatenated into one buffer and every mobject's ``points`` becomes a
+    view into it, so each frame is one gather and one batched matrix product
+    no matter how many members there are."""
+    def __init__(self, group, angles=0.0, scales=1.0, shifts=ORIGIN, axes=OUT, about_points=None, **kwargs):
+        n_members = len(group.submobjects)
+        self.angles = np.broadcast_to(np.asarray(angles, dtype=np.float64), (n_members,)).copy()
+        self.scales = np.broadcast_to(np.asarray(scales, dtype=np.float64), (n_members,)).copy()
+        self.shifts = np.broadcast_to(np.asarray(shifts, dtype=np.float64), (n_members, 3)).copy()
+        self.axes = np.broadcast_to(np.asarray(axes, dtype=np.float64), (n_members, 3)).copy()
+        self.about_points = about_points
+        super().__init__(group, **kwargs)
+
+    def begin(self):
+        chunks, owners = [], []
+        for index, member in enumerate(self.mobject.submobjects):
+            for mob in member.family_members_with_points():
+                chunks.append(mob)
+                owners.append(np.full(len(mob.points), index))
+        self.point_owner = np.concatenate(owners) if owners else np.zeros(0, dtype=int)
+        self.start_points = np.concatenate([mob.points for mob in chunks]) if chunks else np.zeros((0, 3))
+        self.buffer = self.start_points.copy()
+        start = 0
+        for mob in chunks:
+            mob.points = self.buffer[start:start + len(mob.points)]
+            start += len(mob.points)
+        if self.about_points is None:
+            self.centers = np.array([member.get_center() for member in self.mobject.submobjects]).reshape(-1, 3)
+        else:
+            self.centers = np.broadcast_to(np.asarray(self.about_points, dtype=np.float64), self.shifts.shape).copy()
+        self.relative_points = self.start_points - self.centers[self.point_owner]
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        matrices = _rotation_matrices(self.angles * t, self.axes) * interpolate(1.0, self.scales, t)[:, None, None]
+        owner = self.point_owner
+        transformed = np.einsum("nij,nj->ni", matrices[owner], self.relative_points)
+        np.add(transformed, (self.centers + t * self.shifts)[owner], out=self.buffer)
+
+class BatchedRotate(BatchedRigidTransform):
+    def __init__(self, group, angles, axes=OUT, about_points=None, **kwargs):
+        super().__init__(group, angles=angles, axes=axes, about_points=about_points, **kwargs)
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+BENCHMARK_CACHE_DIR = os.path.join("media", "benchmarks")
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+METHOD_BIT_LIMITS = {"trial_division": 48, "pollard_rho": 80, "quadratic_sieve": 92}
+SMALL_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+
+def is_probable_prime(n):
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2; s += 1
+    for a in SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def random_prime(bits, rng):
+    while True:
+        candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        if is_probable_prime(candidate):
+            return candidate
+
+def random_semiprime(bits, rng):
+    p = random_prime(bits // 2, rng)
+    while True:
+        q = random_prime(bits - bits // 2, rng)
+        if q != p and (p * q).bit_length() == bits:
+            return p * q
+
+def small_primes_up_to(limit):
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    sieve[4::2] = False
+    for i in range(3, math.isqrt(limit) + 1, 2):
+        if sieve[i]:
+            sieve[i * i::2 * i] = False
+    return np.nonzero(sieve)[0]
+
+def trial_division(n, chunk=1 << 20):
+    if n % 2 == 0:
+        return 2
+    if n >= 1 << 62:
+        raise ValueError("trial_division works on int64 moduli only")
+    n64 = np.int64(n)
+    limit = math.isqrt(n)
+    for start in range(3, limit + 1, 2 * chunk):
+        candidates = np.arange(start, min(start + 2 * chunk, limit + 1), 2, dtype=np.int64)
+        hits = np.flatnonzero(n64 % candidates == 0)
+        if hits.size:
+            return int(candidates[hits[0]])
+    return n
+
+def pollard_rho(n, seed=1):
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(seed)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g, r, q = 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+def _sqrt_mod_prime(n, p):
+    n %= p
+    if p == 2:
+        return n
+    if p % 4 == 3:
+        return pow(n, (p + 1) // 4, p)
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q //= 2; s += 1
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    m, c, t, r = s, pow(z, q, p), pow(n, q, p), pow(n, (q + 1) // 2, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p; i += 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+def _gf2_dependencies(rows):
+    """Null-space vectors of a GF(2) exponent matrix, one bitmask over relations each."""
+    pivots = {}
+    for i, row in enumerate(rows):
+        combo = 1 << i
+        while row:
+            bit = row.bit_length() - 1
+            if bit not in pivots:
+                pivots[bit] = (row, combo)
+                break
+            pivot_row, pivot_combo = pivots[bit]
+            row ^= pivot_row; combo ^= pivot_combo
+        else:
+            yield combo
+
+QS_BLOCK_SIZE = 1 << 16
+QS_MAX_BLOCKS = 4096
+
+def _prime_power_roots(n, p, max_power):
+    """Square roots of ``n`` modulo ``p, p^2, ...`` (odd ``p``), lifted by Hensel."""
+    t = _sqrt_mod_prime(n, p)
+    roots, pk = [], p
+    while pk <= max_power:
+        roots.append((pk, {t, (-t) % pk}))
+        t = (t - (t * t - n) * pow(2 * t, -1, pk * p)) % (pk * p)
+        pk *= p
+    return roots
+
+def _quadratic_sieve_parameters(n):
+    ln_n = math.log(n)
+    bound = int(math.exp(0.55 * math.sqrt(ln_n * math.log(ln_n)))) + 100
+    return bound, 2 * math.log2(bound) + 2
+
+def quadratic_sieve(n):
+    """Factor ``n`` with the quadratic sieve (single large-prime variation).
+
+    Blocks of ``x = isqrt(n) + d`` are sieved outwards from ``sqrt(n)`` with
+    every factor-base prime power; ``2`` is credited by the parity of ``x``.
+    Positions whose log sum comes within two large-prime sizes of
+    ``log2 |x^2 - n|`` are trial-divided. Full relations are kept and partials
+    sharing a large prime are paired until the GF(2) matrix has more rows than
+    columns. Raises ``RuntimeError`` rather than falling back to another method."""
+    if n % 2 == 0:
+        return 2
+    root = math.isqrt(n)
+    if root * root == n:
+        return root
+    bound, slack = _quadratic_sieve_parameters(n)
+    primes = [int(p) for p in small_primes_up_to(bound)]
+    for p in primes:
+        if n % p == 0:
+            return p
+    factor_base = [2] + [p for p in primes[1:] if pow(n, (p - 1) // 2, p) == 1]
+    index = {p: j for j, p in enumerate(factor_base)}
+    fb_array = np.array(factor_base[1:], dtype=np.int64)
+    n_mod = np.array([n % p for p in factor_base[1:]], dtype=np.int64)
+    sieve_roots = [(pk, r, math.log2(p)) for p in factor_base[1:] for pk, roots in _prime_power_roots(n, p, QS_BLOCK_SIZE) for r in roots]
+    two_credit = 1 + (2 if n % 8 == 1 else 1 if n % 4 == 1 else 0)
+    large_limit = factor_base[-1] ** 2
+    r0 = root * root - n
+    relations, vectors, partials = [], [], {}
+    wanted = len(factor_base) + 20
+    for block in range(QS_MAX_BLOCKS):
+        start = (block // 2) * QS_BLOCK_SIZE if block % 2 == 0 else -(block // 2 + 1) * QS_BLOCK_SIZE
+        x0 = root + start
+        logs = np.zeros(QS_BLOCK_SIZE, dtype=np.float32)
+        logs[(1 - x0) % 2::2] += two_credit
+        for pk, r, lp in sieve_roots:
+            logs[(r - x0) % pk::pk] += lp
+        block_residues = np.array([x0 % p for p in factor_base[1:]], dtype=np.int64)
+        d = np.arange(QS_BLOCK_SIZE, dtype=np.float64) + start
+        log_q = np.log2(np.abs(r0 + 2.0 * root * d + d * d) + 1)
+        for offset in np.flatnonzero(logs >= log_q - slack):
+            x = x0 + int(offset)
+            q = x * x - n
+            if q == 0:
+                continue
+            value, vector = abs(q), 1 if q < 0 else 0
+            while value % 2 == 0:
+                value //= 2; vector ^= 2
+            residues = (block_residues + int(offset)) % fb_array
+            for p in fb_array[(residues * residues - n_mod) % fb_array == 0]:
+                p = int(p)
+                while value % p == 0:
+                    value //= p; vector ^= 1 << (index[p] + 1)
+            if value == 1:
+                relations.append((x, q)); vectors.append(vector)
+            elif value < large_limit:
+                if value in partials:
+                    px, pq, pvector = partials.pop(value)
+                    relations.append((x * px, q * pq)); vectors.append(vector ^ pvector)
+                else:
+                    partials[value] = (x, q, vector)
+        if len(relations) < wanted:
+            continue
+        for combo in _gf2_dependencies(vectors):
+            members = [relations[i] for i in range(len(relations)) if combo >> i & 1]
+            x = math.prod(r[0] for r in members) % n
+            y = math.isqrt(math.prod(r[1] for r in members)) % n
+            g = math.gcd(x - y, n)
+            if 1 < g < n:
+                return g
+        wanted = len(relations) + 10
+    raise RuntimeError(f"quadratic sieve found no factor of {n}")
+
+FACTORING_METHODS = {"trial_division": trial_division, "pollard_rho": pollard_rho, "quadratic_sieve": quadratic_sieve}
+
+def _time_factoring(task):
+    method, bits, seed = task
+    n = random_semiprime(bits, random.Random(seed))
+    start = time.perf_counter()
+    factor = FACTORING_METHODS[method](n)
+    elapsed = time.perf_counter() - start
+    if not (1 < factor < n and n % factor == 0):
+        raise RuntimeError(f"{method} returned {factor} for {n}")
+    return method, bits, elapsed
+
+def growth_feature(method, bits):
+    bits = np.asarray(bits, dtype=np.float64)
+    if method == "quadratic_sieve":
+        ln_n = bits * math.log(2)
+        return np.sqrt(ln_n * np.log(ln_n))
+    return bits
+
+@dataclass
+class BenchmarkResult:
+    machine: str
+    timings: dict = field(default_factory=dict)
+    fits: dict = field(default_factory=dict)
+
+    def fit(self):
+        for method, samples in self.timings.items():
+            bits = np.array([b for b, _ in samples], dtype=np.float64)
+            seconds = np.array([max(t, 1e-6) for _, t in samples])
+            if len(np.unique(bits)) >= 2:
+                slope, intercept = np.polyfit(growth_feature(method, bits), np.log(seconds), 1)
+                self.fits[method] = (float(slope), float(intercept))
+        return self
+
+    def extrapolate(self, method, bits):
+        slope, intercept = self.fits[method]
+        return np.exp(intercept + slope * growth_feature(method, bits))
+
+    def median_timings(self, method):
+        by_bits = {}
+        for bits, seconds in self.timings.get(method, []):
+            by_bits.setdefault(bits, []).append(seconds)
+        bits = np.array(sorted(by_bits))
+        return bits, np.array([np.median(by_bits[b]) for b in bits])
+
+    def years_to_factor(self, bits=2048, method="quadratic_sieve"):
+        return float(self.extrapolate(method, bits)) / SECONDS_PER_YEAR
+
+def run_benchmark(bit_lengths=range(24, 101, 4), trials=3, budget_s=20.0, per_task_cap_s=2.0, workers=None, seed=2048):
+    """Time each method on semiprimes of growing size in a process pool.
+
+    Every bit length is one round of ``len(methods) * trials`` parallel tasks; a
+    method drops out once its median time passes ``per_task_cap_s`` and the
+    whole run stops at ``budget_s``."""
+    result = BenchmarkResult(machine=platform.node())
+    active = set(FACTORING_METHODS)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for bits in bit_lengths:
+            tasks = [(m, bits, seed + bits * 1000 + t) for m in sorted(active) if bits <= METHOD_BIT_LIMITS[m] for t in range(trials)]
+            if not tasks or time.perf_counter() - start > budget_s:
+                break
+            per_method = {}
+            for method, b, seconds in pool.map(_time_factoring, tasks):
+                result.timings.setdefault(method, []).append((b, seconds))
+                per_method.setdefault(method, []).append(seconds)
+            active -= {m for m, times in per_method.items() if np.median(times) > per_task_cap_s}
+    return result.fit()
+
+def code_version():
+    """Hash of this module's source, so timings of an older implementation are never reused."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+def load_or_run_benchmark(cache_dir=BENCHMARK_CACHE_DIR, **kwargs):
+    path = os.path.join(cache_dir, f"classical_factoring_{platform.node() or 'local'}_{code_version()}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+        result = BenchmarkResult(machine=data["machine"], timings={m: [tuple(s) for s in v] for m, v in data["timings"].items()})
+        return result.fit()
+    result = run_benchmark(**kwargs)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"machine": result.machine, "timings": result.timings}, f)
+    return result
+
+if __name__ == "__main__":
+    bench = run_benchmark()
+    for method in bench.fits:
+        bits, seconds = bench.median_timings(method)
+        print(f"{method}: measured up to {bits.max()} bits, 2048-bit estimate {float(bench.extrapolate(method, 2048)) / SECONDS_PER_YEAR:.3g} years")
@@ -0,0 +1,110 @@
+from manim import *
+import numpy as np
+
+def adaptive_samples(function, t_min, t_max, tolerance, min_segments=16, max_samples=4096):
+    """Parameter values and points of ``function`` refined level by level: every
+    segment whose midpoint strays more than ``tolerance`` from its chord is
+    split, with all new midpoints of a level evaluated in one batch."""
+    ts = np.linspace(t_min, t_max, min_segments + 1)
+    points = function(ts)
+    while len(ts) < max_samples:
+        mids = (ts[:-1] + ts[1:]) / 2
+        mid_points = function(mids)
+        error = np.linalg.norm(mid_points - (points[:-1] + points[1:]) / 2, axis=1)
+        split = np.flatnonzero(error > tolerance)
+        if not split.size:
+            break
+        split = np.sort(split[np.argsort(error[split])[::-1][:max_samples - len(ts)]])
+        ts = np.insert(ts, split + 1, mids[split])
+        points = np.insert(points, split + 1, mid_points[split], axis=0)
+    return ts, points
+
+class AdaptiveParametricFunction(ParametricFunction):
+    """``ParametricFunction`` whose sample count follows its size on screen.
+
+    Samples are placed where the curve bends, until the anchor polyline is
+    within ``tolerance_px`` output pixels of the curve, so a curve shrunk to a
+    few pixels keeps only ``min_segments`` Bezier curves. There is no updater,
+    so the curve stays static for frame caching: its on-screen extent is
+    compared with the one last sampled only when it is scaled, rotated or
+    stretched directly, and when a ``Transform`` (including ``.animate`` on a
+    group holding it) finishes. Once it has changed by more than
+    ``resample_ratio`` the curve is re-sampled in its original coordinates
+    and mapped through the affine placement recovered from the current
+    anchors. Points that are not an affine image of the last sampling
+    (morphs) or are shared with another buffer are left alone."""
+    def __init__(self, function, t_range=(0, 1), tolerance_px=0.75, min_segments=16, max_samples=4096,
+                 resample_ratio=1.5, **kwargs):
+        self.tolerance_px, self.min_segments, self.max_samples = tolerance_px, min_segments, max_samples
+        self.resample_ratio = resample_ratio
+        self.model_anchors, self.sampled_extent = None, 0.0
+        super().__init__(function, t_range=t_range, **kwargs)
+
+    def evaluate(self, ts):
+        ts = self.scaling.function(ts)
+        if self.use_vectorized:
+            values = list(self.function(ts))
+            if len(values) == 2:
+                values.append(np.zeros_like(values[0]))
+            return np.stack(values, axis=1).astype(np.float64)
+        return np.array([self.function(t) for t in ts], dtype=np.float64)
+
+    def sample_model(self, units_per_pixel):
+        _, anchors = adaptive_samples(
+            self.evaluate, self.t_min, self.t_max, self.tolerance_px * units_per_pixel, self.min_segments, self.max_samples,
+        )
+        return anchors
+
+    def set_anchors(self, anchors):
+        self.clear_points()
+        self.start_new_path(anchors[0])
+        self.add_points_as_corners(anchors[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        self.sampled_extent = np.linalg.norm(np.ptp(self.points, axis=0))
+        return self
+
+    def generate_points(self):
+        if self.discontinuities is not None:
+            return super().generate_points()
+        self.model_anchors = self.sample_model(config.frame_width / config.pixel_width)
+        return self.set_anchors(self.model_anchors)
+
+    init_points = generate_points
+
+    def current_anchors(self):
+        if self.model_anchors is None or len(self.points) != 4 * (len(self.model_anchors) - 1):
+            return None
+        return np.concatenate([self.points[::4], self.points[-1:]])
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        super().apply_points_function_about_point(func, about_point, about_edge)
+        return self.refresh_level_of_detail()
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path()):
+        super().interpolate(mobject1, mobject2, alpha, path_func)
+        if np.isclose(alpha, 1) and isinstance(mobject2, AdaptiveParametricFunction):
+            self.model_anchors, self.sampled_extent = mobject2.model_anchors, mobject2.sampled_extent
+            self.refresh_level_of_detail()
+        return self
+
+    def refresh_level_of_detail(self):
+        anchors = self.current_anchors()
+        if anchors is None or not self.points.flags.owndata or not self.sampled_extent:
+            return self
+        extent = np.linalg.norm(np.ptp(self.points, axis=0))
+        if self.sampled_extent / self.resample_ratio <= extent <= self.sampled_extent * self.resample_ratio:
+            return self
+        model = np.column_stack([self.model_anchors, np.ones(len(anchors))])
+        placement, *_ = np.linalg.lstsq(model, anchors, rcond=None)
+        if np.abs(model @ placement - anchors).max() > 1e-6 * max(extent, 1e-3):
+            return self
+        stretch = max(np.linalg.svd(placement[:3], compute_uv=False)[0], 1e-9)
+        self.model_anchors = self.sample_model(config.frame_width / (config.pixel_width * stretch))
+        return self.set_anchors(self.model_anchors @ placement[:3] + placement[3])
+
+def adaptive_plot(axes, function, x_range, **kwargs):
+    """``axes.plot`` built from an :class:`AdaptiveParametricFunction`."""
+    graph = AdaptiveParametricFunction(lambda t: axes.coords_to_point(t, function(t)), t_range=x_range[:2], **kwargs)
+    graph.underlying_function = function
+    return graph
@@ -0,0 +1,193 @@
+import argparse
+import contextlib
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from manim import *
+import manim.mobject.text.tex_mobject as tex_mobject
+import manim.mobject.text.text_mobject as text_mobject
+from manim.utils.tex_file_writing import generate_tex_file
+
+import atlas_math
+from frame_render import FrameSeekMixin, replay_scene
+from render_cache import load_scene_module
+
+PLACEHOLDER_DIR = os.path.join(tempfile.gettempdir(), "dry_run_placeholders")
+
+@dataclass
+class DryRunReport:
+    duration: float = 0.0
+    frame_rate: float = 0.0
+    segments: list = field(default_factory=list)
+    peak_mobjects: int = 0
+    texts: dict = field(default_factory=dict)
+    tex: dict = field(default_factory=dict)
+    cached: set = field(default_factory=set)
+    atlas_missing: bool = False
+
+    def summary(self):
+        lines = [f"duration {self.duration:.2f}s, {round(self.duration * self.frame_rate)} frames, peak {self.peak_mobjects} mobjects"]
+        lines += [f"  {name:<32} {frames:>6} frames  peak {peak} mobjects" for name, _, frames, peak in self.segments]
+        lines.append(f"{len(self.texts)} Text strings ({len(self.texts.keys() - self.cached)} uncached), "
+                     f"{len(self.tex)} TeX strings ({len(self.tex.keys() - self.cached)} uncached)")
+        if self.atlas_missing:
+            lines.append(f"glyph atlas {atlas_math.ATLAS_PATH} missing")
+        return "\n".join(lines)
+
+    def uncached(self, jobs):
+        return [job for key, job in jobs.items() if key not in self.cached]
+
+def placeholder_svg(key, glyph_count):
+    """A stand-in SVG with one small box per glyph, so character-indexed code
+    (``t2c``, submobject slicing) keeps working while nothing is typeset."""
+    os.makedirs(PLACEHOLDER_DIR, exist_ok=True)
+    path = os.path.join(PLACEHOLDER_DIR, f"{hashlib.sha256(key.encode()).hexdigest()[:24]}_{glyph_count}.svg")
+    if not os.path.exists(path):
+        boxes = "".join(f'<path d="M{10 * i} 0h8v10h-8z"/>' for i in range(max(glyph_count, 1)))
+        with open(path, "w") as f:
+            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{10 * max(glyph_count, 1)}" height="10">{boxes}</svg>')
+    return path
+
+def placeholder_atlas():
+    """An atlas with a small box for every glyph, so ``math_tex`` takes the same
+    atlas-or-``MathTex`` branch it will take in the real render."""
+    corners = np.array([[0.05, 0, 0], [0.45, 0, 0], [0.45, 0.7, 0], [0.05, 0.7, 0], [0.05, 0, 0]])
+    box = np.concatenate([[p, p + (q - p) / 3, p + 2 * (q - p) / 3, q] for p, q in zip(corners, corners[1:])])
+    return {key: (box, 0.5, 0.7, 0.0) for key, _ in atlas_math.atlas_glyph_specs()}, 0.2
+
+class AssetRecorder:
+    """While active, every ``Text``/``MarkupText`` and ``MathTex`` request is
+    recorded (cache hits are marked in ``report.cached``) and the uncached ones
+    are answered with placeholders instead of calling Pango or LaTeX. A missing
+    glyph atlas is not built but replaced by :func:`placeholder_atlas`."""
+    def __init__(self, report):
+        self.report = report
+        self.constructor_stack = []
+        self.original_load_atlas = atlas_math.load_atlas
+
+    def _wrap_init(self, cls):
+        original = cls.__init__
+        recorder = self
+
+        def __init__(self, *args, **kwargs):
+            recorder.constructor_stack.append((cls.__name__, args, kwargs))
+            try:
+                original(self, *args, **kwargs)
+            finally:
+                recorder.constructor_stack.pop()
+        return __init__
+
+    def _wrap_text2svg(self, cls):
+        original = cls._text2svg
+        recorder = self
+
+        def _text2svg(self, color):
+            file_name = config.get_dir("text_dir") / (self._text2hash(color) + ".svg")
+            name, args, kwargs = recorder.constructor_stack[-1]
+            key = repr((name, args, sorted(kwargs.items())))
+            recorder.report.texts.setdefault(key, (name, args, kwargs))
+            if file_name.exists():
+                recorder.report.cached.add(key)
+                return original(self, color)
+            return placeholder_svg(file_name.stem, len("".join(self.text.split())))
+        return _text2svg
+
+    def _tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        tex_template = tex_template or config["tex_template"]
+        svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        self.report.tex.setdefault(svg_file.stem, (expression, environment, tex_template))
+        if svg_file.exists():
+            self.report.cached.add(svg_file.stem)
+            return svg_file
+        return Path(placeholder_svg(svg_file.stem, 1))
+
+    def _load_atlas(self, path=atlas_math.ATLAS_PATH):
+        if os.path.exists(path):
+            return self.original_load_atlas(path)
+        if not self.report.atlas_missing:
+            self.report.atlas_missing = True
+            self.stand_in_atlas = placeholder_atlas()
+        return self.stand_in_atlas
+
+    @contextlib.contextmanager
+    def active(self):
+        patches = [(tex_mobject, "tex_to_svg_file", self._tex_to_svg_file), (atlas_math, "load_atlas", self._load_atlas)]
+        for cls in (Text, MarkupText):
+            patches += [(cls, "__init__", self._wrap_init(cls)), (cls, "_text2svg", self._wrap_text2svg(cls))]
+        saved = [(owner, name, getattr(owner, name)) for owner, name, _ in patches]
+        for owner, name, value in patches:
+            setattr(owner, name, value)
+        try:
+            yield self
+        finally:
+            for owner, name, value in saved:
+                setattr(owner, name, value)
+
+class DryRunMixin(FrameSeekMixin):
+    """Replays the scene logic-only and records timing, per-section frame
+    counts and the peak number of mobjects on screen."""
+    save_snapshots = False
+
+    def setup(self):
+        super().setup()
+        self.segment_marks = [(type(self).__name__.removesuffix("Replay"), 0.0, 0)]
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        if self.renderer.time == self.segment_marks[-1][1]:
+            self.segment_marks.pop()
+        self.segment_marks.append((name, self.renderer.time, 0))
+
+    def play_internal(self, skip_rendering=False):
+        super().play_internal(skip_rendering)
+        name, start, peak = self.segment_marks[-1]
+        self.segment_marks[-1] = (name, start, max(peak, len(self.get_mobject_family_members())))
+
+def dry_run(scene_cls):
+    """Run ``scene_cls`` without rasterizing, encoding, Pango or LaTeX and
+    return a :class:`DryRunReport` of what the real render will need."""
+    report = DryRunReport(frame_rate=config.frame_rate)
+    with AssetRecorder(report).active():
+        scene = replay_scene(scene_cls, mixin=DryRunMixin)
+    report.duration = scene.renderer.time
+    ends = [start for _, start, _ in scene.segment_marks[1:]] + [report.duration]
+    report.segments = [
+        (name, start, round((end - start) * report.frame_rate), peak)
+        for (name, start, peak), end in zip(scene.segment_marks, ends)
+    ]
+    report.peak_mobjects = max((peak for *_, peak in report.segments), default=0)
+    return report
+
+def _typeset_text(cls_name, args, kwargs):
+    getattr(text_mobject, cls_name)(*args, **kwargs)
+    return cls_name
+
+def warm_assets(report, workers=None):
+    """Produce every uncached SVG and a missing glyph atlas up front: LaTeX jobs
+    in a thread pool (the work happens in latex/dvisvgm subprocesses), Pango
+    jobs in a process pool."""
+    workers = workers or os.cpu_count()
+    with ThreadPoolExecutor(workers) as threads, ProcessPoolExecutor(workers) as processes:
+        futures = [threads.submit(tex_mobject.tex_to_svg_file, *job) for job in report.uncached(report.tex)]
+        futures += [processes.submit(_typeset_text, *job) for job in report.uncached(report.texts)]
+        if report.atlas_missing:
+            futures.append(threads.submit(atlas_math.build_atlas))
+        for future in futures:
+            future.result()
+    return len(futures)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dry-run a scene and prefetch the Text/TeX assets it needs.")
+    parser.add_argument("file", nargs="?", default="video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("--no-warm", action="store_true", help="only report, do not typeset anything")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    module = load_scene_module(args.file)
+    report = dry_run(getattr(module, args.scene))
+    print(report.summary())
+    if not args.no_warm:
+        print(f"warmed {warm_assets(report, args.workers)} assets")
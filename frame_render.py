@@ -0,0 +1,118 @@
+import argparse
+from pathlib import Path
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from PIL import Image
+
+from render_cache import load_scene_module
+
+class AllFramesCaptured(Exception):
+    pass
+
+class SeekRenderer(CairoRenderer):
+    """Cairo renderer that replays plays without rasterizing or encoding
+    anything; a frame is only drawn while ``capturing`` is set."""
+    def __init__(self, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.capturing = False
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        return None
+
+    def update_frame(self, scene, *args, **kwargs):
+        if self.capturing:
+            super().update_frame(scene, *args, **kwargs)
+
+class FrameSeekMixin:
+    """Mixed in front of a scene class: every ``play``/``wait`` jumps straight to
+    its end state unless one of ``frame_times`` falls inside it, in which case
+    the animations are interpolated to that instant and :meth:`capture_frame`
+    is called. Construction stops once the last requested time is reached."""
+    frame_times = ()
+    stop_when_done = True
+
+    def setup(self):
+        super().setup()
+        self.pending_times = sorted(self.frame_times)
+        self.captured_frames = {}
+
+    @property
+    def resume_before(self):
+        return self.pending_times[0] if self.pending_times else None
+
+    def is_current_animation_frozen_frame(self):
+        return False
+
+    def play_internal(self, skip_rendering=False):
+        duration = self.get_run_time(self.animations)
+        start = self.renderer.time - duration
+        while self.pending_times and self.pending_times[0] < start + duration:
+            t = self.pending_times.pop(0)
+            self.update_to_time(max(t - start, 0))
+            self.capture_frame(t)
+        super().play_internal(skip_rendering=True)
+        if self.stop_when_done and not self.pending_times and self.frame_times:
+            raise AllFramesCaptured()
+
+    def capture_frame(self, t):
+        self.renderer.capturing = True
+        self.renderer.update_frame(self)
+        self.renderer.capturing = False
+        self.captured_frames[t] = self.renderer.get_frame()
+
+    def finish_replay(self):
+        for t in self.pending_times:
+            self.capture_frame(t)
+        self.pending_times = []
+
+def replay_scene(scene_cls, mixin=FrameSeekMixin, **attrs):
+    """Run ``scene_cls.construct`` under ``mixin`` without encoding and return the scene."""
+    seek_cls = type(f"{scene_cls.__name__}Replay", (mixin, scene_cls), attrs)
+    scene = seek_cls(renderer=SeekRenderer())
+    scene.setup()
+    try:
+        scene.construct()
+        scene.tear_down()
+    except AllFramesCaptured:
+        pass
+    scene.finish_replay()
+    return scene
+
+def render_frames(scene_cls, times):
+    """RGBA arrays for every timestamp in ``times`` (seconds from scene start),
+    produced by a single logic-only replay of the scene."""
+    scene = replay_scene(scene_cls, frame_times=tuple(float(t) for t in times))
+    return scene.captured_frames
+
+def render_frame(scene_cls, t):
+    return render_frames(scene_cls, [t])[float(t)]
+
+def save_frames(frames, out_dir, prefix):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for t, frame in sorted(frames.items()):
+        path = out_dir / f"{prefix}_{t:08.3f}s.png"
+        Image.fromarray(frame).save(path)
+        paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render single frames of a scene at given timestamps.")
+    parser.add_argument("file", help="scene module, e.g. video.py")
+    parser.add_argument("scene")
+    parser.add_argument("times", nargs="+", type=float, help="timestamps in seconds")
+    parser.add_argument("-o", "--out-dir", default=str(Path("media", "frames")))
+    parser.add_argument("-r", "--resolution", default=None, help="WIDTH,HEIGHT, e.g. 640,360")
+    args = parser.parse_args()
+    overrides = {}
+    if args.resolution:
+        width, height = (int(v) for v in args.resolution.split(","))
+        overrides = {"pixel_width": width, "pixel_height": height}
+    with tempconfig(overrides):
+        module = load_scene_module(args.file)
+        frames = render_frames(getattr(module, args.scene), args.times)
+        for path in save_frames(frames, args.out_dir, args.scene):
+            print(path)
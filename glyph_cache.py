@@ -0,0 +1,134 @@
+from manim import *
+import numpy as np
+
+GLYPH_TILE_CACHE = {}
+
+def _bezier_points(curves, u):
+    u = u[None, :, None]
+    return ((1 - u)**3 * curves[:, None, 0] + 3 * (1 - u)**2 * u * curves[:, None, 1]
+            + 3 * (1 - u) * u**2 * curves[:, None, 2] + u**3 * curves[:, None, 3])
+
+def _fit_cubic(samples, start, end, start_tangent, end_tangent):
+    chord = np.linalg.norm(samples[1:] - samples[:-1], axis=1)
+    u = np.concatenate([[0.0], np.cumsum(chord)])
+    if u[-1] == 0:
+        return np.array([start, start, end, end])
+    u /= u[-1]
+    b0, b1, b2, b3 = (1 - u)**3, 3 * (1 - u)**2 * u, 3 * (1 - u) * u**2, u**3
+    a1 = start_tangent[None, :] * b1[:, None]
+    a2 = end_tangent[None, :] * b2[:, None]
+    rhs = samples - np.outer(b0 + b1, start) - np.outer(b2 + b3, end)
+    c = np.array([[np.sum(a1 * a1), np.sum(a1 * a2)], [np.sum(a1 * a2), np.sum(a2 * a2)]])
+    x = np.array([np.sum(a1 * rhs), np.sum(a2 * rhs)])
+    det = c[0, 0] * c[1, 1] - c[0, 1] * c[1, 0]
+    alpha = np.linalg.solve(c, x) if abs(det) > 1e-12 else np.zeros(2)
+    fallback = np.linalg.norm(end - start) / 3.0
+    if alpha[0] < 1e-6 or alpha[1] < 1e-6:
+        alpha = np.array([fallback, fallback])
+    return np.array([start, start + alpha[0] * start_tangent, end + alpha[1] * end_tangent, end])
+
+def _tangent(p, q, r):
+    v = q - p
+    if np.linalg.norm(v) < 1e-9:
+        v = r - p
+    n = np.linalg.norm(v)
+    return v / n if n > 0 else v
+
+def _simplify_subpath(curves, tolerance, samples_per_curve=8):
+    u = np.linspace(0, 1, samples_per_curve + 1)
+    samples = _bezier_points(curves, u)
+    result = []
+    i = 0
+    while i < len(curves):
+        best = curves[i]
+        j = i + 1
+        while j < len(curves):
+            pts = np.concatenate([samples[i, :1], samples[i:j + 1, 1:].reshape(-1, 3)])
+            fit = _fit_cubic(
+                pts, curves[i, 0], curves[j, 3],
+                _tangent(curves[i, 0], curves[i, 1], curves[i, 2]),
+                _tangent(curves[j, 3], curves[j, 2], curves[j, 1]),
+            )
+            error = np.linalg.norm(_bezier_points(fit[None], np.linspace(0, 1, len(pts)))[0] - pts, axis=1).max()
+            if error > tolerance:
+                break
+            best = fit
+            j += 1
+        result.append(best)
+        i = j
+    return np.concatenate(result)
+
+def simplify_outline(mobject, tolerance_px=0.35, max_scale=1.0):
+    """Merge neighbouring Bezier segments of every outline in ``mobject`` while
+    staying within ``tolerance_px`` of the original at the output resolution,
+    assuming the mobject is never shown larger than ``max_scale`` times its size."""
+    tolerance = tolerance_px * config.frame_height / (config.pixel_height * max_scale)
+    for mob in mobject.family_members_with_points():
+        if not isinstance(mob, VMobject):
+            continue
+        subpaths = mob.get_subpaths()
+        mob.clear_points()
+        for subpath in subpaths:
+            curves = np.asarray(subpath).reshape(-1, 4, 3)
+            mob.append_points(_simplify_subpath(curves, tolerance) if len(curves) > 1 else subpath)
+    return mobject
+
+def rasterize_mobject(mobject, max_scale=1.0, padding_px=2):
+    px_per_unit = config.pixel_height * max_scale / config.frame_height
+    padding = padding_px / px_per_unit
+    width = mobject.width + 2 * padding
+    height = mobject.height + 2 * padding
+    camera = Camera(
+        pixel_width=int(np.ceil(width * px_per_unit)), pixel_height=int(np.ceil(height * px_per_unit)),
+        frame_width=width, frame_height=height, frame_center=mobject.get_center(),
+        background_opacity=0,
+    )
+    camera.capture_mobject(mobject)
+    return camera.pixel_array.copy()
+
+class GlyphTile(ImageMobject):
+    """Rasterized stand-in for large text that is only ever moved, scaled or faded.
+    Opacity scales the rasterized glyph mask instead of replacing it."""
+    def __init__(self, pixel_array, max_scale=1.0, **kwargs):
+        super().__init__(pixel_array.copy(), scale_to_resolution=config.pixel_height * max_scale, **kwargs)
+        self.max_scale = max_scale
+        self.alpha_mask = self.pixel_array[:, :, 3].copy()
+
+    def set_opacity(self, alpha):
+        self.pixel_array[:, :, 3] = np.round(self.alpha_mask * np.clip(alpha, 0, 1)).astype(self.pixel_array.dtype)
+        self.fill_opacity = self.stroke_opacity = alpha
+        return self
+
+def cached_text(text_str, max_scale=1.0, **text_kwargs):
+    """``Text`` rendered once at the largest size it will reach on screen and
+    reused as a :class:`GlyphTile` for every later frame and every copy."""
+    key = (text_str, max_scale, config.pixel_height, tuple(sorted((k, repr(v)) for k, v in text_kwargs.items())))
+    if key not in GLYPH_TILE_CACHE:
+        text = simplify_outline(Text(text_str, **text_kwargs), max_scale=max_scale)
+        GLYPH_TILE_CACHE[key] = rasterize_mobject(text, max_scale=max_scale)
+    return GlyphTile(GLYPH_TILE_CACHE[key], max_scale=max_scale)
+
+def clear_glyph_tiles():
+    GLYPH_TILE_CACHE.clear()
+
+def benchmark_glyph_tile(text_str="2048", frames=60, max_scale=1.3, **text_kwargs):
+    """Seconds per frame to capture ``text_str`` as vector ``Text`` and as a
+    :class:`GlyphTile`, while it scales from 1 to ``max_scale`` and fades."""
+    import time
+    text_kwargs.setdefault("font_size", 280)
+    results = {}
+    for name, make in (("vector", lambda: Text(text_str, **text_kwargs)), ("tile", lambda: cached_text(text_str, max_scale, **text_kwargs))):
+        mobject, camera = make(), Camera()
+        start = time.perf_counter()
+        for i in range(frames):
+            t = i / max(frames - 1, 1)
+            frame = mobject.copy().scale(1 + (max_scale - 1) * t).set_opacity(1 - 0.75 * t)
+            camera.reset()
+            camera.capture_mobject(frame)
+        results[name] = (time.perf_counter() - start) / frames
+    return results
+
+if __name__ == "__main__":
+    timings = benchmark_glyph_tile()
+    print("  ".join(f"{name}: {seconds * 1000:.1f} ms/frame" for name, seconds in timings.items()),
+          f"speedup: {timings['vector'] / timings['tile']:.1f}x")
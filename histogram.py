@@ -0,0 +1,54 @@
+from manim import *
+import numpy as np
+
+BAR_HEIGHT_TEMPLATE = np.array([0, 0, 0, 0, 0, 1/3, 2/3, 1, 1, 1, 1, 1, 1, 2/3, 1/3, 0])
+BAR_WIDTH_TEMPLATE = np.array([0, 1/3, 2/3, 1, 1, 1, 1, 1, 1, 2/3, 1/3, 0, 0, 0, 0, 0])
+
+class MeasurementHistogram(VMobject):
+    """All bars of a histogram as the subpaths of a single ``VMobject``.
+
+    Bar heights live in one array; :meth:`set_heights` rewrites every bar with a
+    couple of broadcast operations, so thousands of bars cost one path fill per
+    frame. An invisible ``chart_frame`` submobject marks the chart's bottom-left,
+    bottom-right and top-left corners so moves, scales and rotations of the
+    chart are respected when the heights change."""
+    def __init__(self, heights, width=9.0, height=3.0, max_value=None, bar_gap=0.15,
+                 color=TEAL, fill_opacity=0.9, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=fill_opacity, stroke_width=0, **kwargs)
+        self.heights = np.asarray(heights, dtype=np.float64).copy()
+        self.max_value = float(max_value if max_value is not None else max(self.heights.max(), 1e-12))
+        n_bars = len(self.heights)
+        left = np.arange(n_bars) + bar_gap / 2
+        self.bar_u = ((left[:, None] + (1 - bar_gap) * BAR_WIDTH_TEMPLATE[None, :]) / n_bars).ravel()
+        self.chart_frame = VMobject(stroke_width=0, fill_opacity=0).set_points(
+            np.array([[-width/2, -height/2, 0], [width/2, -height/2, 0], [-width/2, height/2, 0], [width/2, height/2, 0]])
+        )
+        self.add(self.chart_frame)
+        self.set_heights(self.heights)
+
+    def set_heights(self, heights):
+        self.heights = np.asarray(heights, dtype=np.float64)
+        bottom_left, bottom_right, top_left = self.chart_frame.points[:3]
+        bar_v = (np.clip(self.heights, 0, None) / self.max_value)[:, None] * BAR_HEIGHT_TEMPLATE[None, :]
+        self.points = bottom_left + np.outer(self.bar_u, bottom_right - bottom_left) + np.outer(bar_v.ravel(), top_left - bottom_left)
+        return self
+
+    def get_bar_top(self, index):
+        return self.points[16 * index + 7]
+
+class AnimateHistogram(Animation):
+    """Morph a :class:`MeasurementHistogram` into new heights with one
+    vectorized interpolation per frame."""
+    def __init__(self, histogram, target_heights, **kwargs):
+        self.target_heights = np.asarray(target_heights, dtype=np.float64)
+        super().__init__(histogram, **kwargs)
+
+    def begin(self):
+        self.start_heights = self.mobject.heights.copy()
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_heights(interpolate(self.start_heights, self.target_heights, self.rate_func(alpha)))
@@ -0,0 +1,98 @@
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from render_cache import (
+    RENDER_CACHE_DIR, SceneFingerprinter, concat_segments, find_rendered_file, load_scene_module, render_section,
+    section_classes,
+)
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+LOCALE_ENV = "VIDEO_LOCALE"
+SOURCE_LOCALE = "en"
+STRING_USAGE = set()
+_tables = {}
+
+def available_locales():
+    return [SOURCE_LOCALE] + sorted(p.stem for p in Path(LOCALE_DIR).glob("*.json"))
+
+def load_table(locale):
+    if locale == SOURCE_LOCALE:
+        return {}
+    if locale not in _tables:
+        _tables[locale] = json.loads(Path(LOCALE_DIR, f"{locale}.json").read_text(encoding="utf-8"))
+    return _tables[locale]
+
+def active_locale():
+    return os.environ.get(LOCALE_ENV, SOURCE_LOCALE)
+
+def set_locale(locale):
+    os.environ[LOCALE_ENV] = locale
+
+def tr(text):
+    """Translate an on-screen source string into the active locale, falling back
+    to the source text, and record that the string was used."""
+    STRING_USAGE.add(text)
+    return load_table(active_locale()).get(text, text)
+
+def strings_used_by(scene_cls):
+    """Source strings passed to :func:`tr` while replaying ``scene_cls`` logic-only."""
+    from frame_render import replay_scene
+    # Scenes import ``localization``; as ``python localization.py`` this file is
+    # ``__main__``, so the recorded strings live in that other module object.
+    import localization
+    previous = active_locale()
+    set_locale(SOURCE_LOCALE)
+    localization.STRING_USAGE.clear()
+    try:
+        replay_scene(scene_cls)
+    finally:
+        set_locale(previous)
+    return set(localization.STRING_USAGE)
+
+def render_localized(module_path, locales=None, scene_name="FullVideo", manim_args=(), cache_dir=RENDER_CACHE_DIR):
+    """Render every locale of ``scene_name`` in one job. A section is rendered
+    once per distinct set of translations it actually shows; sections without
+    translated text are rendered once, under the same name
+    :func:`render_cache.render_incremental` uses, and shared by all locales."""
+    module = load_scene_module(module_path)
+    fingerprinter = SceneFingerprinter(Path(module_path).parent)
+    locales = locales or available_locales()
+    segments, rerendered = {locale: [] for locale in locales}, []
+    for section in section_classes(getattr(module, scene_name)):
+        fingerprint = hashlib.sha256((fingerprinter.fingerprint_scene(section) + repr(list(manim_args))).encode()).hexdigest()
+        used = sorted(strings_used_by(section))
+        variants = {}
+        for locale in locales:
+            table = load_table(locale)
+            translated = {text: table[text] for text in used if table.get(text, text) != text}
+            key = fingerprint
+            if translated:
+                key = hashlib.sha256((fingerprint + json.dumps(translated, sort_keys=True)).encode()).hexdigest()
+            variants.setdefault(key, []).append(locale)
+        for key, variant_locales in variants.items():
+            output_name = f"{section.__name__}_{key[:16]}"
+            segment = find_rendered_file(module_path, output_name)
+            if segment is None:
+                env = {**os.environ, LOCALE_ENV: variant_locales[0]}
+                segment = render_section(module_path, section, output_name, manim_args, env=env)
+                rerendered.append((section.__name__, variant_locales))
+            for locale in variant_locales:
+                segments[locale].append(segment)
+    finals = {locale: concat_segments(paths, Path(cache_dir, f"{scene_name}_{locale}.mp4")) for locale, paths in segments.items()}
+    return finals, rerendered
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every locale of a video, sharing all non-text segments.")
+    parser.add_argument("file", help="scene module, e.g. video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("--locale", action="append", help="locales to render (default: all in locales/)")
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER, help="extra manim flags, e.g. -qh")
+    args = parser.parse_args()
+    finals, rerendered = render_localized(args.file, args.locale, args.scene, args.manim_args)
+    for section, locales in rerendered:
+        print(f"rendered {section} for {', '.join(locales)}")
+    for locale, path in finals.items():
+        print(f"{locale}: {path}")
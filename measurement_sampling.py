@@ -0,0 +1,112 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+DENSE_REGISTER_BITS = 22
+
+def modular_powers(base, exponents, modulus):
+    """``base ** exponents % modulus`` elementwise, by square-and-multiply over
+    the exponent bits; ``base`` may be a scalar or an array."""
+    exponents = np.asarray(exponents, dtype=np.int64)
+    result = np.ones(np.broadcast(base, exponents).shape, dtype=np.int64)
+    square = np.asarray(base, dtype=np.int64) % modulus
+    remaining = exponents.copy()
+    while np.any(remaining):
+        odd = (remaining & 1).astype(bool)
+        result = np.where(odd, result * square % modulus, result)
+        square = square * square % modulus
+        remaining >>= 1
+    return result
+
+def check_coprime_base(N, a):
+    """Period finding needs ``a`` in Z_N^*; a shared factor has no period to find."""
+    if math.gcd(a, N) != 1:
+        raise ValueError(f"base {a} is not coprime to {N} (gcd {math.gcd(a, N)})")
+
+def register_distribution(N, a, n_count):
+    """Exact outcome probabilities of the ``n_count``-qubit counting register
+    after modular exponentiation and the inverse QFT."""
+    check_coprime_base(N, a)
+    Q = 1 << n_count
+    residues = modular_powers(a, np.arange(Q), N)
+    probs = np.zeros(Q)
+    for value in np.unique(residues):
+        probs += np.abs(np.fft.fft(residues == value) / Q) ** 2
+    return probs / probs.sum()
+
+def continued_fraction_denominators(numerators, denominator, limit):
+    """Largest convergent denominator below ``limit`` of every ``numerators / denominator``."""
+    num = np.asarray(numerators, dtype=np.int64).copy()
+    den = np.full_like(num, denominator)
+    k_prev, k = np.ones_like(num), np.zeros_like(num)
+    best = np.ones_like(num)
+    active = np.ones(num.shape, dtype=bool)
+    while np.any(active):
+        safe_den = np.where(den == 0, 1, den)
+        term = num // safe_den
+        k_next = term * k + k_prev
+        active &= (den != 0) & (k_next < limit)
+        best = np.where(active, k_next, best)
+        num, den = den, np.where(active, num - term * safe_den, 0)
+        k_prev, k = k, k_next
+    return best
+
+@dataclass
+class PeriodSamples:
+    N: int
+    a: int
+    n_count: int
+    outcomes: np.ndarray
+    counts: np.ndarray
+    candidate_periods: np.ndarray
+    valid_period: np.ndarray
+    factors: np.ndarray
+    success: np.ndarray
+
+    @property
+    def shots(self):
+        return len(self.outcomes)
+
+    @property
+    def success_rate(self):
+        return float(self.success.mean()) if self.shots else 0.0
+
+    @property
+    def period(self):
+        valid = self.candidate_periods[self.valid_period]
+        return int(np.bincount(valid).argmax()) if valid.size else 0
+
+def recover_factors(N, a, outcomes, n_count):
+    """Continued-fraction period candidates and the two gcd checks for every
+    outcome, as ``(candidates, valid, factors, success)``."""
+    candidates = continued_fraction_denominators(outcomes, 1 << n_count, N)
+    valid = modular_powers(a, candidates, N) == 1
+    usable = valid & (candidates % 2 == 0)
+    half_power = modular_powers(a, candidates // 2, N)
+    usable &= half_power != N - 1
+    factors = np.stack([np.gcd(half_power - 1, N), np.gcd(half_power + 1, N)], axis=-1)
+    factors[~usable] = 1
+    success = usable & np.any((factors > 1) & (factors < N), axis=-1)
+    return candidates, valid, factors, success
+
+def sample_period_finding(N, a, n_count=None, shots=4096, probs=None, seed=None):
+    """Sample ``shots`` counting-register outcomes at once and post-process all of them.
+
+    Registers above ``DENSE_REGISTER_BITS`` qubits are sampled from the
+    closed-form distribution in :mod:`shor_distribution` instead of a dense
+    probability vector; ``counts`` is ``None`` then."""
+    if n_count is None:
+        n_count = 2 * int(N - 1).bit_length()
+    if probs is None and n_count > DENSE_REGISTER_BITS:
+        from shor_distribution import sample_register
+        outcomes, counts = sample_register(N, a, n_count, shots, seed=seed), None
+    else:
+        if probs is None:
+            probs = register_distribution(N, a, n_count)
+        rng = np.random.default_rng(seed)
+        counts = rng.multinomial(shots, probs)
+        outcomes = np.repeat(np.arange(len(probs)), counts)
+        rng.shuffle(outcomes)
+    candidates, valid, factors, success = recover_factors(N, a, outcomes, n_count)
+    return PeriodSamples(N, a, n_count, outcomes, counts, candidates, valid, factors, success)
@@ -0,0 +1,228 @@
+import argparse
+import math
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from measurement_sampling import modular_powers
+
+ORDER_TABLE_DIR = os.path.join("media", "order_tables")
+DEFAULT_BOUND = 10**6
+DEFAULT_DETAIL_BOUND = 1 << 12
+CHUNK_SIZE = 1 << 14
+
+_spf = None
+
+def smallest_prime_factors(limit):
+    """``spf[n]`` is the smallest prime factor of ``n`` for every ``n <= limit``."""
+    spf = np.zeros(limit + 1, dtype=np.int32)
+    for p in range(2, math.isqrt(limit) + 1):
+        if spf[p] == 0:
+            block = spf[p * p::p]
+            block[block == 0] = p
+    unset = spf == 0
+    spf[unset] = np.arange(limit + 1, dtype=np.int32)[unset]
+    return spf
+
+def factorize(n, spf):
+    factors = {}
+    while n > 1:
+        p = int(spf[n])
+        factors[p] = factors.get(p, 0) + 1
+        n //= p
+    return factors
+
+def carmichael_lambda(factors):
+    """λ(N) from the factorization; for odd N this is the lcm of φ(p^e)."""
+    result = 1
+    for p, e in factors.items():
+        component = p ** (e - 1) * (p - 1)
+        if p == 2 and e >= 3:
+            component //= 2
+        result = math.lcm(result, component)
+    return result
+
+def euler_phi(factors):
+    return math.prod(p ** (e - 1) * (p - 1) for p, e in factors.items())
+
+def good_base_count(factors):
+    """Number of bases in Z_N^* that Shor's reduction succeeds with, in closed form.
+
+    A base fails exactly when its order has the same 2-adic valuation modulo
+    every prime power of N (all zero: odd ``r``; all equal and positive:
+    ``a^(r/2) = -1``). In a cyclic group of order ``m = 2^v * o`` there are
+    ``o`` elements of odd order and ``o * 2^(k-1)`` whose order has valuation
+    ``k``, so the failures are a short sum of products."""
+    components = [p ** (e - 1) * (p - 1) for p, e in factors.items()]
+    valuations = [(m & -m).bit_length() - 1 for m in components]
+    odd_parts = [m >> v for m, v in zip(components, valuations)]
+    failing = sum(
+        math.prod(o if k == 0 else o << (k - 1) for o in odd_parts)
+        for k in range(min(valuations) + 1)
+    )
+    return math.prod(components) - failing
+
+def multiplicative_orders(N, bases, lam, spf):
+    """Orders of ``bases`` modulo ``N`` (0 where ``gcd(a, N) > 1``), found by
+    dividing λ(N) by its prime factors while ``a^(λ/p) = 1``, for all bases at once."""
+    bases = np.asarray(bases, dtype=np.int64)
+    orders = np.full(bases.shape, lam, dtype=np.int64)
+    for p in factorize(lam, spf):
+        while True:
+            divisible = orders % p == 0
+            reducible = divisible & (modular_powers(bases, np.where(divisible, orders // p, 0), N) == 1)
+            if not reducible.any():
+                break
+            orders = np.where(reducible, orders // p, orders)
+    orders[np.gcd(bases, N) != 1] = 0
+    return orders
+
+def good_bases_mask(N, bases, orders):
+    half = modular_powers(np.asarray(bases, dtype=np.int64), orders // 2, N)
+    return (orders > 0) & (orders % 2 == 0) & (half != N - 1)
+
+def is_odd_composite(N, spf):
+    return N > 2 and N % 2 == 1 and spf[N] != N
+
+def _init_worker(bound):
+    global _spf
+    _spf = smallest_prime_factors(bound)
+
+def _summary_chunk(span):
+    start, stop = span
+    lam, phi, good = (np.zeros(stop - start, dtype=np.int64) for _ in range(3))
+    for N in range(start | 1, stop, 2):
+        if is_odd_composite(N, _spf):
+            factors = factorize(N, _spf)
+            i = N - start
+            lam[i], phi[i], good[i] = carmichael_lambda(factors), euler_phi(factors), good_base_count(factors)
+    return start, lam, phi, good
+
+def _detail_chunk(task):
+    start, stop, lam = task
+    orders, good = [], []
+    for N in range(start, stop):
+        if lam[N - start]:
+            bases = np.arange(N)
+            base_orders = multiplicative_orders(N, bases, int(lam[N - start]), _spf)
+            orders.append(base_orders)
+            good.append(good_bases_mask(N, bases, base_orders))
+    return start, orders, good
+
+def table_dir(bound, detail_bound, cache_dir=ORDER_TABLE_DIR):
+    return os.path.join(cache_dir, f"bound_{bound}_detail_{detail_bound}")
+
+def build_tables(bound=DEFAULT_BOUND, detail_bound=DEFAULT_DETAIL_BOUND, workers=None, cache_dir=ORDER_TABLE_DIR):
+    """Compute λ(N), φ(N) and the good-base count for every odd composite
+    ``N <= bound``, plus the order and good flag of every base for
+    ``N <= detail_bound``, in a process pool, and store them as ``.npy`` files."""
+    detail_bound = min(detail_bound, bound)
+    lam, phi, good = (np.zeros(bound + 1, dtype=np.int64) for _ in range(3))
+    spans = [(start, min(start + CHUNK_SIZE, bound + 1)) for start in range(0, bound + 1, CHUNK_SIZE)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(bound,)) as pool:
+        for start, *chunk in pool.map(_summary_chunk, spans):
+            for target, values in zip((lam, phi, good), chunk):
+                target[start:start + len(values)] = values
+        detail_spans = [(s, min(s + 256, detail_bound + 1)) for s in range(0, detail_bound + 1, 256)]
+        offsets = np.zeros(detail_bound + 2, dtype=np.int64)
+        orders, flags = [], []
+        for start, chunk_orders, chunk_good in pool.map(_detail_chunk, [(s, e, lam[s:e]) for s, e in detail_spans]):
+            orders += chunk_orders
+            flags += chunk_good
+    sizes = np.where(lam[:detail_bound + 1] > 0, np.arange(detail_bound + 1), 0)
+    offsets[1:] = np.cumsum(sizes)
+    arrays = {
+        "lambda": lam, "phi": phi, "good_count": good, "offsets": offsets,
+        "orders": np.concatenate(orders).astype(np.uint32) if orders else np.zeros(0, np.uint32),
+        "good": np.concatenate(flags) if flags else np.zeros(0, bool),
+    }
+    final_dir = table_dir(bound, detail_bound, cache_dir)
+    temp_dir = f"{final_dir}.{os.getpid()}.tmp"
+    os.makedirs(temp_dir, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(temp_dir, f"{name}.npy"), array)
+    shutil.rmtree(final_dir, ignore_errors=True)
+    os.replace(temp_dir, final_dir)
+    return OrderTables(final_dir)
+
+class OrderTables:
+    """Read-only, memory-mapped view of the tables written by :func:`build_tables`.
+    Per-base queries above the detail bound fall back to computing orders for
+    that one modulus from λ(N) and its factorization."""
+    def __init__(self, path):
+        self.path = path
+        load = lambda name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+        self.lam, self.phi, self.good_count = load("lambda"), load("phi"), load("good_count")
+        self.offsets, self.order_table, self.good_table = load("offsets"), load("orders"), load("good")
+        self.bound = len(self.lam) - 1
+        self.detail_bound = len(self.offsets) - 2
+        self._spf = None
+
+    @property
+    def spf(self):
+        if self._spf is None:
+            self._spf = smallest_prime_factors(self.bound)
+        return self._spf
+
+    def _check(self, N):
+        if not (0 < N <= self.bound and self.lam[N]):
+            raise ValueError(f"{N} is not an odd composite up to {self.bound}")
+
+    def orders(self, N):
+        self._check(N)
+        if N <= self.detail_bound:
+            return np.asarray(self.order_table[self.offsets[N]:self.offsets[N + 1]], dtype=np.int64)
+        return multiplicative_orders(N, np.arange(N), int(self.lam[N]), self.spf)
+
+    def order(self, N, a):
+        self._check(N)
+        if N <= self.detail_bound:
+            return int(self.order_table[self.offsets[N] + a % N])
+        return int(multiplicative_orders(N, [a % N], int(self.lam[N]), self.spf)[0])
+
+    def good_bases(self, N):
+        self._check(N)
+        if N <= self.detail_bound:
+            return np.flatnonzero(self.good_table[self.offsets[N]:self.offsets[N + 1]])
+        return np.flatnonzero(good_bases_mask(N, np.arange(N), self.orders(N)))
+
+    def is_good_base(self, N, a):
+        if N <= self.detail_bound:
+            self._check(N)
+            return bool(self.good_table[self.offsets[N] + a % N])
+        return bool(good_bases_mask(N, [a % N], np.array([self.order(N, a)]))[0])
+
+    def good_fraction(self, N):
+        self._check(N)
+        return self.good_count[N] / self.phi[N]
+
+    def moduli(self, min_N=3, max_N=None, min_lambda=0, min_good_fraction=0.0):
+        """Odd composites in ``[min_N, max_N]`` meeting the filters, e.g. to pick
+        the modulus of an episode."""
+        max_N = self.bound if max_N is None else min(max_N, self.bound)
+        lam, phi, good = (np.asarray(a[min_N:max_N + 1]) for a in (self.lam, self.phi, self.good_count))
+        keep = (lam > 0) & (lam >= min_lambda) & (good >= min_good_fraction * phi)
+        return np.flatnonzero(keep) + min_N
+
+def load_or_build_tables(bound=DEFAULT_BOUND, detail_bound=DEFAULT_DETAIL_BOUND, cache_dir=ORDER_TABLE_DIR, **kwargs):
+    path = table_dir(bound, min(detail_bound, bound), cache_dir)
+    if os.path.exists(os.path.join(path, "good.npy")):
+        return OrderTables(path)
+    return build_tables(bound, detail_bound, cache_dir=cache_dir, **kwargs)
+
+def multiplicative_order(N, a):
+    """Order of ``a`` modulo ``N`` without any table, for one-off scene queries."""
+    spf = smallest_prime_factors(max(N, 2))
+    return int(multiplicative_orders(N, [a], carmichael_lambda(factorize(N, spf)), spf)[0])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build memory-mapped multiplicative-order tables.")
+    parser.add_argument("--bound", type=int, default=DEFAULT_BOUND)
+    parser.add_argument("--detail-bound", type=int, default=DEFAULT_DETAIL_BOUND, help="store per-base orders up to this modulus")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    tables = build_tables(args.bound, args.detail_bound, args.workers)
+    moduli = tables.moduli()
+    print(f"{len(moduli)} odd composites up to {tables.bound}, per-base orders up to {tables.detail_bound}, stored in {tables.path}")
@@ -0,0 +1,200 @@
+from manim import *
+import numpy as np
+
+RATE_TABLE_SAMPLES = 257
+VECTOR_PARTICLE_LIMIT = 256
+PARTICLE_OPTIONS = ("opacities", "end_opacities", "end_scales", "path_arcs", "delays", "lifetimes", "rate_funcs", "rate_func_index")
+
+def lagged_timing(count, lag_ratio):
+    """Start times and lifetimes, as fractions of the whole emission, that
+    reproduce ``LaggedStart(..., lag_ratio=lag_ratio)`` over ``count`` particles."""
+    span = 1 + lag_ratio * max(count - 1, 0)
+    return np.arange(count) * lag_ratio / span, np.full(count, 1 / span)
+
+def _per_particle(values, count, width=None):
+    shape = (count,) if width is None else (count, width)
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), shape).copy()
+
+class ParticleState:
+    """Particle arrays and their motion, shared by the image and dot renderers.
+
+    Every particle property (start/end position, arc, radius, colour, opacity,
+    start time, lifetime, easing) is an array; :meth:`advance` moves all of
+    them with a handful of broadcast operations. Easing functions are sampled
+    once into lookup tables and picked per particle through ``rate_func_index``."""
+    def init_particles(self, starts, ends, radii, colors, opacities=1.0, end_opacities=0.0, end_scales=1.0,
+                       path_arcs=0.0, delays=0.0, lifetimes=1.0, rate_funcs=(linear,), rate_func_index=0):
+        self.starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        count = len(self.starts)
+        self.ends = _per_particle(ends, count, 3)
+        self.radii = _per_particle(radii, count)
+        if not isinstance(colors, np.ndarray):
+            colors = [ManimColor(c).to_rgb() for c in ([colors] * count if isinstance(colors, (str, ManimColor)) else colors)]
+        self.colors = _per_particle(colors, count, 3)
+        self.opacities = _per_particle(opacities, count)
+        self.end_opacities = _per_particle(end_opacities, count)
+        self.end_scales = _per_particle(end_scales, count)
+        self.path_arcs = _per_particle(path_arcs, count)
+        self.delays = _per_particle(delays, count)
+        self.lifetimes = _per_particle(lifetimes, count)
+        samples = np.linspace(0, 1, RATE_TABLE_SAMPLES)
+        self.rate_tables = np.array([[func(t) for t in samples] for func in rate_funcs])
+        self.rate_func_index = np.broadcast_to(np.asarray(rate_func_index, dtype=np.int64), (count,)).copy()
+
+    def reachable_box(self, samples=65):
+        """Lower-left and upper-right ``(x, y)`` corners bounding every particle
+        over the whole emission, including easing overshoot and the largest radius."""
+        if not len(self.starts):
+            return np.zeros(2), np.zeros(2)
+        progress = np.linspace(self.rate_tables.min(), self.rate_tables.max(), samples)
+        points = np.concatenate([self.positions(np.full(len(self.starts), p))[:, :2] for p in progress])
+        margin = (self.radii * np.maximum(self.end_scales, 1)).max() + 2 * config.frame_width / config.pixel_width
+        return points.min(axis=0) - margin, points.max(axis=0) + margin
+
+    def eased_progress(self, t):
+        local = np.clip((t - self.delays) / np.maximum(self.lifetimes, 1e-9), 0, 1) * (RATE_TABLE_SAMPLES - 1)
+        low = np.minimum(local.astype(np.int64), RATE_TABLE_SAMPLES - 2)
+        frac = local - low
+        table = self.rate_tables[self.rate_func_index]
+        rows = np.arange(len(low))
+        return table[rows, low] * (1 - frac) + table[rows, low + 1] * frac
+
+    def positions(self, progress):
+        chords = self.ends - self.starts
+        straight = self.starts + progress[:, None] * chords
+        arcs = self.path_arcs
+        curved = np.abs(arcs) > 1e-6
+        if not curved.any():
+            return straight
+        safe_arcs = np.where(curved, arcs, 1.0)
+        centers = self.starts + 0.5 * chords + np.cross(OUT, chords / 2) / np.tan(safe_arcs / 2)[:, None]
+        offsets = self.starts - centers
+        angles = safe_arcs * progress
+        cos, sin = np.cos(angles), np.sin(angles)
+        rotated = np.stack([cos * offsets[:, 0] - sin * offsets[:, 1], sin * offsets[:, 0] + cos * offsets[:, 1], offsets[:, 2]], axis=1)
+        return np.where(curved[:, None], centers + rotated, straight)
+
+    def advance(self, t):
+        progress = self.eased_progress(t)
+        self.particle_centers = self.positions(progress)
+        self.particle_radii = self.radii * interpolate(1.0, self.end_scales, progress)
+        self.particle_opacities = interpolate(self.opacities, self.end_opacities, progress)
+
+    def to_vector_elements(self):
+        """Visible particles of the current frame as plain circle descriptions."""
+        return [
+            {"type": "circle", "center": center[:2].tolist(), "radius": float(radius), "fill": rgb_to_hex(rgb), "opacity": float(opacity)}
+            for center, radius, rgb, opacity in zip(self.particle_centers, self.particle_radii, self.colors, self.particle_opacities)
+            if opacity > 0 and radius > 0
+        ]
+
+class ParticleSystem(ParticleState, ImageMobject):
+    """Any number of round particles splatted with ``np.bincount`` into one
+    image layer that covers only the area the particles can reach, at the
+    output pixel density, so the per-frame cost is independent of the number
+    of Python objects involved."""
+    def __init__(self, starts, ends, radii, colors, resolution=None, **kwargs):
+        particle_kwargs = {key: kwargs.pop(key) for key in PARTICLE_OPTIONS if key in kwargs}
+        self.init_particles(starts, ends, radii, colors, **particle_kwargs)
+        px_per_unit = (resolution or (config.pixel_width, config.pixel_height))[0] / config.frame_width
+        low, high = self.reachable_box()
+        width, height = np.maximum(np.ceil((high - low) * px_per_unit).astype(np.int64), 1)
+        super().__init__(np.zeros((height, width, 4), dtype=np.uint8), **kwargs)
+        self.stretch_to_fit_height(height / px_per_unit).stretch_to_fit_width(width / px_per_unit).move_to(np.append((low + high) / 2, 0))
+        self.dirty_box = None
+        self.set_time(0)
+
+    def set_time(self, t):
+        self.advance(t)
+        self.splat()
+        return self
+
+    def splat(self):
+        pixels = self.pixel_array
+        height, width = pixels.shape[:2]
+        if self.dirty_box is not None:
+            top, bottom, left, right = self.dirty_box
+            pixels[top:bottom, left:right] = 0
+            self.dirty_box = None
+        upper_left, upper_right, lower_left = self.points[:3]
+        px_per_unit = width / np.linalg.norm(upper_right - upper_left)
+        cx = (self.particle_centers[:, 0] - upper_left[0]) * px_per_unit
+        cy = (upper_left[1] - self.particle_centers[:, 1]) * (height / np.linalg.norm(upper_left - lower_left))
+        radii = self.particle_radii * px_per_unit
+        alpha = self.particle_opacities
+        visible = (alpha > 0) & (radii > 0) & (cx > -radii) & (cx < width + radii) & (cy > -radii) & (cy < height + radii)
+        if not visible.any():
+            return
+        cx, cy, radii, alpha, rgb = cx[visible], cy[visible], radii[visible], alpha[visible], self.colors[visible]
+        offsets = np.arange(-int(np.ceil(radii.max())) - 1, int(np.ceil(radii.max())) + 2)
+        cols = np.floor(cx).astype(np.int64)[:, None] + offsets
+        rows = np.floor(cy).astype(np.int64)[:, None] + offsets
+        dist = np.hypot((cols + 0.5 - cx[:, None])[:, None, :], (rows + 0.5 - cy[:, None])[:, :, None])
+        cover = np.clip(radii[:, None, None] - dist + 0.5, 0, 1) * alpha[:, None, None]
+        cols = np.broadcast_to(cols[:, None, :], cover.shape)
+        rows = np.broadcast_to(rows[:, :, None], cover.shape)
+        inside = (cover > 0) & (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        if not inside.any():
+            return
+        rows, cols, cover = rows[inside], cols[inside], np.minimum(cover[inside], 0.999)
+        owner = np.broadcast_to(np.arange(len(cx))[:, None, None], inside.shape)[inside]
+        top, bottom, left, right = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+        flat = (rows - top) * (right - left) + (cols - left)
+        size = (bottom - top) * (right - left)
+        weight = np.bincount(flat, cover, size)
+        color_sum = np.stack([np.bincount(flat, cover * rgb[owner, c], size) for c in range(3)], axis=1)
+        coverage = 1 - np.exp(np.bincount(flat, np.log1p(-cover), size))
+        layer = np.concatenate([color_sum / np.maximum(weight, 1e-12)[:, None], coverage[:, None]], axis=1)
+        pixels[top:bottom, left:right] = np.round(layer * 255).astype(np.uint8).reshape(bottom - top, right - left, 4)
+        self.dirty_box = (top, bottom, left, right)
+
+class DotParticles(ParticleState, VGroup):
+    """The same particles as one small ``VMobject`` circle each, whose points
+    and fill are rewritten every frame. For small bursts this is cheaper than
+    resampling and compositing an image layer."""
+    def __init__(self, starts, ends, radii, colors, resolution=None, **kwargs):
+        particle_kwargs = {key: kwargs.pop(key) for key in PARTICLE_OPTIONS if key in kwargs}
+        self.init_particles(starts, ends, radii, colors, **particle_kwargs)
+        super().__init__(**kwargs)
+        self.unit_circle = Circle(radius=1).points
+        self.add(*(VMobject(stroke_width=0, fill_opacity=0) for _ in range(len(self.starts))))
+        self.set_time(0)
+
+    def set_time(self, t):
+        self.advance(t)
+        for dot, center, radius, rgb, opacity in zip(self.submobjects, self.particle_centers, self.particle_radii, self.colors, self.particle_opacities):
+            dot.points = self.unit_circle * max(radius, 0) + center
+            dot.set_fill(rgb_to_color(rgb), opacity=max(opacity, 0))
+        return self
+
+class EmitParticles(Animation):
+    """Run a :class:`ParticleSystem` or :class:`DotParticles` from its first to its last frame; the
+    per-particle easing lives in the system, so the animation itself is linear."""
+    def __init__(self, particle_system, **kwargs):
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(particle_system, **kwargs)
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_time(self.rate_func(alpha))
+
+def radial_burst(origin, count, distance_range, radius_range, colors, opacity_range=(1.0, 1.0), scale_range=(1.0, 1.0),
+                 arc_range=(0.0, 0.0), rate_funcs=(linear,), lag_ratio=0.0, seed=None, **kwargs):
+    """Emitter: ``count`` particles flying out of ``origin`` in random directions
+    and fading out, with every property drawn uniformly from its range. Up to
+    ``VECTOR_PARTICLE_LIMIT`` particles are drawn as :class:`DotParticles`."""
+    rng = np.random.default_rng(seed)
+    directions = rng.uniform(0, TAU, count)
+    distances = rng.uniform(*distance_range, count)
+    offsets = np.stack([np.cos(directions), np.sin(directions), np.zeros(count)], axis=1) * distances[:, None]
+    delays, lifetimes = lagged_timing(count, lag_ratio)
+    system = DotParticles if count <= VECTOR_PARTICLE_LIMIT else ParticleSystem
+    return system(
+        starts=np.tile(np.asarray(origin, dtype=np.float64), (count, 1)), ends=np.asarray(origin) + offsets,
+        radii=rng.uniform(*radius_range, count), colors=colors, opacities=rng.uniform(*opacity_range, count),
+        end_scales=rng.uniform(*scale_range, count), path_arcs=rng.uniform(*arc_range, count),
+        delays=delays, lifetimes=lifetimes, rate_funcs=rate_funcs,
+        rate_func_index=rng.integers(len(rate_funcs), size=count), **kwargs,
+    )
@@ -0,0 +1,214 @@
+import argparse
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+RENDER_CACHE_DIR = os.path.join("media", "render_cache")
+CONSTANT_TYPES = (str, bytes, int, float, complex, bool, type(None), tuple, frozenset)
+
+def load_scene_module(path):
+    path = Path(path).resolve()
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+def _is_project_module(module, project_dir):
+    source = getattr(module, "__file__", None)
+    return source is not None and Path(source).resolve().parent == project_dir
+
+def _is_project_object(obj, project_dir):
+    return _is_project_module(sys.modules.get(getattr(obj, "__module__", None) or ""), project_dir)
+
+def project_imports(module, project_dir):
+    """Project modules that ``module`` imports, either as modules or through
+    names taken from them with ``from ... import``."""
+    imported = set()
+    for value in vars(module).values():
+        source_module = value if isinstance(value, types.ModuleType) else sys.modules.get(getattr(value, "__module__", None) or "")
+        if source_module is not None and source_module is not module and _is_project_module(source_module, project_dir):
+            imported.add(source_module)
+    return imported
+
+class SceneFingerprinter:
+    """Hashes everything a scene's ``construct`` can observe from the project:
+    its bytecode and constants, nested functions and lambdas, the source of
+    every project class in the MRO of a class it uses, transitively every
+    project-level helper or constant it reads through a global name, the
+    source of every project module it reads through a module name, and the
+    module-level setup calls (``arc_length.install()``) of the scene's module.
+    Project modules the scene never reaches do not count. Library objects
+    (manim, numpy) are identified by their package version instead of their
+    contents."""
+    def __init__(self, project_dir):
+        self.project_dir = Path(project_dir).resolve()
+        self.memo = {}
+
+    def fingerprint_parts(self, scene_cls):
+        """One digest per project class in the MRO of ``scene_cls`` plus one for
+        the setup calls of its module, keyed by name."""
+        parts = {klass.__qualname__: self.fingerprint_object(klass) for klass in scene_cls.__mro__ if _is_project_object(klass, self.project_dir)}
+        module = sys.modules.get(scene_cls.__module__)
+        if module is not None and _is_project_module(module, self.project_dir):
+            parts[f"{module.__name__} setup"] = self.fingerprint_setup(module)
+        return parts
+
+    def fingerprint_scene(self, scene_cls):
+        return hashlib.sha256(json.dumps(self.fingerprint_parts(scene_cls), sort_keys=True).encode()).hexdigest()
+
+    def fingerprint_setup(self, module):
+        """Bare module-level calls of ``module``, such as monkeypatch installers,
+        which affect every scene without being referenced by any of them."""
+        key = ("setup", module.__name__)
+        if key not in self.memo:
+            tree = ast.parse(Path(module.__file__).read_text())
+            calls = [stmt for stmt in tree.body if isinstance(stmt, ast.Expr) and not isinstance(stmt.value, ast.Constant)]
+            code = compile(ast.Module(calls, type_ignores=[]), module.__file__, "exec")
+            self.memo[key] = self._fingerprint_code(code, vars(module))
+        return self.memo[key]
+
+    def fingerprint_object(self, obj):
+        key = id(obj)
+        if key in self.memo:
+            return self.memo[key]
+        self.memo[key] = "<recursive>"
+        digest = hashlib.sha256()
+        if isinstance(obj, type):
+            digest.update(obj.__qualname__.encode())
+            for base in obj.__mro__[1:]:
+                if _is_project_object(base, self.project_dir):
+                    digest.update(self.fingerprint_object(base).encode())
+                elif base is not object:
+                    digest.update(self._fingerprint_global(base).encode())
+            try:
+                digest.update(inspect.getsource(obj).encode())
+            except (OSError, TypeError):
+                pass
+            for name, member in sorted(vars(obj).items()):
+                if isinstance(member, (staticmethod, classmethod)):
+                    member = member.__func__
+                if isinstance(member, types.FunctionType):
+                    digest.update(name.encode() + self.fingerprint_object(member).encode())
+                elif isinstance(member, CONSTANT_TYPES):
+                    digest.update(name.encode() + repr(member).encode())
+        elif isinstance(obj, types.FunctionType):
+            digest.update(self._fingerprint_code(obj.__code__, obj.__globals__).encode())
+            digest.update(repr(obj.__defaults__).encode())
+        self.memo[key] = digest.hexdigest()
+        return self.memo[key]
+
+    def _fingerprint_code(self, code, module_globals):
+        digest = hashlib.sha256(code.co_code)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                digest.update(self._fingerprint_code(const, module_globals).encode())
+            else:
+                digest.update(repr(const).encode())
+        for name in code.co_names:
+            digest.update(name.encode())
+            if name in module_globals:
+                digest.update(self._fingerprint_global(module_globals[name]).encode())
+        return digest.hexdigest()
+
+    def _fingerprint_global(self, value):
+        if isinstance(value, np.ndarray):
+            return hashlib.sha256(value.tobytes()).hexdigest()
+        if isinstance(value, CONSTANT_TYPES):
+            return repr(value)
+        if isinstance(value, (types.FunctionType, type)) and _is_project_object(value, self.project_dir):
+            return self.fingerprint_object(value)
+        if isinstance(value, types.ModuleType):
+            source = getattr(value, "__file__", None)
+            if source and Path(source).resolve().parent == self.project_dir:
+                return hashlib.sha256(Path(source).read_bytes()).hexdigest()
+            return f"{value.__name__}=={getattr(value, '__version__', '')}"
+        text = repr(value)
+        if _is_project_object(type(value), self.project_dir):
+            return self.fingerprint_object(type(value)) + ("" if " at 0x" in text else text)
+        if " at 0x" in text:
+            top_package = (getattr(value, "__module__", None) or type(value).__module__ or "").split(".")[0]
+            return f"{top_package}=={getattr(sys.modules.get(top_package), '__version__', '')}"
+        return text
+
+def section_classes(scene_cls):
+    return list(getattr(scene_cls, "sections", (scene_cls,)))
+
+def find_rendered_file(module_path, output_name):
+    movies = Path("media", "videos", Path(module_path).stem)
+    matches = sorted(movies.glob(f"*/{output_name}.mp4"))
+    return matches[0] if matches else None
+
+def manim_command(module_path, scene_name, output_name, manim_args):
+    return [sys.executable, "-m", "manim", *manim_args, "-o", output_name, str(module_path), scene_name]
+
+def render_section(module_path, scene_cls, output_name, manim_args, env=None):
+    subprocess.run(manim_command(module_path, scene_cls.__name__, output_name, manim_args), check=True, env=env)
+    return find_rendered_file(module_path, output_name)
+
+def concat_segments(segment_paths, output_path):
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    list_path = output_path.with_suffix(".txt")
+    list_path.write_text("".join(f"file '{Path(p).resolve()}'\n" for p in segment_paths))
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(list_path), "-c", "copy", str(output_path)], check=True)
+    list_path.unlink()
+    return output_path
+
+def rerender_reason(previous, parts, manim_args):
+    """Why a section without a cached output is rendered, from its previous
+    manifest entry: which fingerprint parts or flags changed."""
+    if not previous:
+        return "not rendered before"
+    old_parts = previous.get("parts", {})
+    changed = sorted(name for name in parts.keys() | old_parts.keys() if parts.get(name) != old_parts.get(name))
+    if previous.get("manim_args") != list(manim_args):
+        changed.append("manim flags")
+    return f"changed: {', '.join(changed)}" if changed else "cached output missing"
+
+def render_incremental(module_path, scene_name="FullVideo", manim_args=(), cache_dir=RENDER_CACHE_DIR):
+    """Render each section of ``scene_name`` only if its fingerprint changed and
+    reassemble the full video from the cached section outputs. Returns the
+    video and ``{section: reason}`` for the sections that were rendered; the
+    reasons come from the fingerprint parts kept in ``manifest.json``."""
+    module = load_scene_module(module_path)
+    fingerprinter = SceneFingerprinter(Path(module_path).parent)
+    manifest_path = Path(cache_dir, "manifest.json")
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    segments, rerendered = [], {}
+    for section in section_classes(getattr(module, scene_name)):
+        parts = fingerprinter.fingerprint_parts(section)
+        fingerprint = hashlib.sha256((fingerprinter.fingerprint_scene(section) + repr(list(manim_args))).encode()).hexdigest()
+        output_name = f"{section.__name__}_{fingerprint[:16]}"
+        segment = find_rendered_file(module_path, output_name)
+        if segment is None:
+            rerendered[section.__name__] = rerender_reason(manifest.get(section.__name__), parts, manim_args)
+            segment = render_section(module_path, section, output_name, manim_args)
+        manifest[section.__name__] = {"fingerprint": fingerprint, "parts": parts, "manim_args": list(manim_args), "output": str(segment)}
+        segments.append(segment)
+    final = concat_segments(segments, Path(cache_dir, f"{scene_name}.mp4"))
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    return final, rerendered
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-render only the scenes whose code or constants changed.")
+    parser.add_argument("file", help="scene module, e.g. video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER, help="extra manim flags, e.g. -qh --fps 60")
+    args = parser.parse_args()
+    final, rerendered = render_incremental(args.file, args.scene, args.manim_args)
+    for section, reason in rerendered.items():
+        print(f"re-rendered {section}: {reason}")
+    if not rerendered:
+        print("re-rendered: nothing")
+    print(f"assembled: {final}")
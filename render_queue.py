@@ -0,0 +1,208 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import time
+from pathlib import Path
+
+from render_cache import SceneFingerprinter, find_rendered_file, load_scene_module, manim_command
+
+QUEUE_DIR = os.path.join("media", "render_queue")
+QUEUE_PATH = os.path.join(QUEUE_DIR, "jobs.sqlite")
+STALE_AFTER_S = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedup_key TEXT UNIQUE NOT NULL,
+    module TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    manim_args TEXT NOT NULL,
+    output_name TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    cpus INTEGER NOT NULL DEFAULT 1,
+    memory_mb INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker_pid INTEGER,
+    heartbeat REAL,
+    created REAL NOT NULL,
+    finished REAL,
+    output TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, priority DESC, id);
+"""
+
+def connect(path=QUEUE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    db = sqlite3.connect(path, timeout=30, isolation_level=None)
+    db.row_factory = sqlite3.Row
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+class _transaction:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def job_key(module_path, scene_name, manim_args):
+    """Deduplication key: the scene's source fingerprint plus its render flags,
+    so identical requests collapse while edited scenes get a fresh job."""
+    module = load_scene_module(module_path)
+    fingerprint = SceneFingerprinter(Path(module_path).parent).fingerprint_scene(getattr(module, scene_name))
+    return hashlib.sha256((fingerprint + repr(list(manim_args))).encode()).hexdigest()
+
+def enqueue(db, module_path, scene_name, manim_args=(), priority=0, cpus=1, memory_mb=0, max_attempts=3):
+    """Queue a render and return its job id. An identical queued or running job
+    is reused (keeping the higher priority), as is a finished one whose output
+    still exists; failed jobs are reset and retried."""
+    key = job_key(module_path, scene_name, manim_args)
+    with _transaction(db):
+        job = db.execute("SELECT * FROM jobs WHERE dedup_key = ?", (key,)).fetchone()
+        if job is None:
+            return db.execute(
+                "INSERT INTO jobs (dedup_key, module, scene, manim_args, output_name, priority, cpus, memory_mb, max_attempts, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, str(Path(module_path).resolve()), scene_name, json.dumps(list(manim_args)), f"{scene_name}_{key[:16]}",
+                 priority, cpus, memory_mb, max_attempts, time.time()),
+            ).lastrowid
+        if job["status"] in ("queued", "running"):
+            db.execute("UPDATE jobs SET priority = MAX(priority, ?) WHERE id = ?", (priority, job["id"]))
+        elif job["status"] == "failed" or not (job["output"] and os.path.exists(job["output"])):
+            db.execute(
+                "UPDATE jobs SET status = 'queued', attempts = 0, priority = ?, cpus = ?, memory_mb = ?, max_attempts = ?, "
+                "error = NULL, output = NULL, finished = NULL WHERE id = ?",
+                (priority, cpus, memory_mb, max_attempts, job["id"]),
+            )
+        return job["id"]
+
+def reap_stale_jobs(db, stale_after_s=STALE_AFTER_S):
+    """Requeue (or fail, once out of attempts) running jobs whose worker died
+    or stopped sending heartbeats."""
+    now = time.time()
+    for job in db.execute("SELECT * FROM jobs WHERE status = 'running'").fetchall():
+        if _pid_alive(job["worker_pid"]) and now - job["heartbeat"] < stale_after_s:
+            continue
+        status = "queued" if job["attempts"] < job["max_attempts"] else "failed"
+        db.execute(
+            "UPDATE jobs SET status = ?, worker_pid = NULL, error = 'worker lost' WHERE id = ?", (status, job["id"])
+        )
+
+def claim_job(db, total_cpus, total_memory_mb):
+    """Atomically take the highest-priority queued job that fits in the cores
+    and memory not already reserved by running jobs across all workers."""
+    with _transaction(db):
+        reap_stale_jobs(db)
+        used_cpus, used_memory = db.execute(
+            "SELECT COALESCE(SUM(cpus), 0), COALESCE(SUM(memory_mb), 0) FROM jobs WHERE status = 'running'"
+        ).fetchone()
+        busy = used_cpus > 0
+        job = db.execute(
+            "SELECT * FROM jobs WHERE status = 'queued' AND (? OR (cpus <= ? AND memory_mb <= ?)) "
+            "ORDER BY priority DESC, id LIMIT 1",
+            (not busy, total_cpus - used_cpus, total_memory_mb - used_memory),
+        ).fetchone()
+        if job is None:
+            return None
+        db.execute(
+            "UPDATE jobs SET status = 'running', worker_pid = ?, heartbeat = ?, attempts = attempts + 1 WHERE id = ?",
+            (os.getpid(), time.time(), job["id"]),
+        )
+        return job
+
+def _start(job):
+    log_path = Path(QUEUE_DIR, "logs", f"{job['id']}.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = manim_command(job["module"], job["scene"], job["output_name"], json.loads(job["manim_args"]))
+    with open(log_path, "ab") as log:
+        return subprocess.Popen(command, cwd=os.getcwd(), stdout=log, stderr=subprocess.STDOUT)
+
+def _finish(db, job, returncode):
+    with _transaction(db):
+        if returncode == 0:
+            output = find_rendered_file(job["module"], job["output_name"])
+            db.execute(
+                "UPDATE jobs SET status = 'done', finished = ?, output = ?, worker_pid = NULL WHERE id = ?",
+                (time.time(), str(output), job["id"]),
+            )
+            return
+        attempts = db.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job["id"],)).fetchone()
+        status = "queued" if attempts["attempts"] < attempts["max_attempts"] else "failed"
+        db.execute(
+            "UPDATE jobs SET status = ?, worker_pid = NULL, error = ? WHERE id = ?",
+            (status, f"manim exited with {returncode}, see logs/{job['id']}.log", job["id"]),
+        )
+
+def run_worker(db_path=QUEUE_PATH, total_cpus=None, total_memory_mb=None, poll_s=1.0, exit_when_idle=False):
+    """Claim and render jobs as local manim subprocesses until interrupted (or
+    until the queue is empty with ``exit_when_idle``), heartbeating while they run."""
+    db = connect(db_path)
+    total_cpus = total_cpus or os.cpu_count()
+    total_memory_mb = total_memory_mb or os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2**20
+    running = {}
+    while True:
+        while True:
+            job = claim_job(db, total_cpus, total_memory_mb)
+            if job is None:
+                break
+            running[job["id"]] = (job, _start(job))
+        for job_id, (job, process) in list(running.items()):
+            if process.poll() is not None:
+                _finish(db, job, process.returncode)
+                del running[job_id]
+        if running:
+            db.execute(
+                f"UPDATE jobs SET heartbeat = ? WHERE id IN ({','.join('?' * len(running))})", (time.time(), *running)
+            )
+        elif exit_when_idle:
+            return
+        time.sleep(poll_s)
+
+def status(db):
+    return db.execute("SELECT id, status, priority, scene, attempts, output, error FROM jobs ORDER BY id").fetchall()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local render job queue backed by SQLite.")
+    parser.add_argument("--db", default=QUEUE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("enqueue", help="queue a scene render")
+    add.add_argument("file")
+    add.add_argument("scene")
+    add.add_argument("--priority", type=int, default=0)
+    add.add_argument("--cpus", type=int, default=1, help="cores the render is expected to use")
+    add.add_argument("--memory", type=int, default=0, help="expected peak memory in MB")
+    add.add_argument("--max-attempts", type=int, default=3)
+    add.add_argument("manim_args", nargs=argparse.REMAINDER)
+    work = commands.add_parser("work", help="run a local worker")
+    work.add_argument("--cpus", type=int, default=None, help="cores shared by all workers (default: all)")
+    work.add_argument("--memory", type=int, default=None, help="memory budget in MB (default: physical memory)")
+    work.add_argument("--exit-when-idle", action="store_true")
+    commands.add_parser("status", help="list jobs")
+    args = parser.parse_args()
+    if args.command == "enqueue":
+        print(enqueue(connect(args.db), args.file, args.scene, args.manim_args, args.priority, args.cpus, args.memory, args.max_attempts))
+    elif args.command == "work":
+        run_worker(args.db, args.cpus, args.memory, exit_when_idle=args.exit_when_idle)
+    else:
+        for row in status(connect(args.db)):
+            print(f"{row['id']:>4} {row['status']:<8} p{row['priority']:<3} {row['scene']:<32} try {row['attempts']} {row['output'] or row['error'] or ''}")
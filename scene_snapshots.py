@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import random
+
+from manim import *
+import numpy as np
+
+from render_cache import SceneFingerprinter
+
+SNAPSHOT_DIR = os.path.join("media", "snapshots")
+NODE_GROUP, NODE_VMOBJECT, NODE_IMAGE = 0, 1, 2
+RGBA_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+class _Buffer:
+    def __init__(self, width, dtype):
+        self.width, self.dtype, self.chunks, self.size = width, dtype, [], 0
+
+    def push(self, values):
+        values = np.asarray(values, dtype=self.dtype).reshape(-1, self.width)
+        self.chunks.append(values)
+        self.size += len(values)
+        return self.size - len(values), self.size
+
+    def array(self):
+        return np.concatenate(self.chunks) if self.chunks else np.zeros((0, self.width), dtype=self.dtype)
+
+def serialize_mobjects(mobjects):
+    """Flatten mobject trees into a few contiguous arrays: one points buffer,
+    one RGBA buffer, one pixel buffer and an integer node table holding the
+    tree structure and the slices of those buffers each node owns."""
+    points, rgbas, pixels = _Buffer(3, np.float64), _Buffer(4, np.float64), _Buffer(1, np.uint8)
+    nodes, scalars, image_shapes = [], [], []
+
+    def visit(mob, parent):
+        index = len(nodes)
+        row = [parent, NODE_GROUP, *points.push(mob.points)] + [0] * 6 + [-1, -1]
+        if isinstance(mob, VMobject):
+            row[1] = NODE_VMOBJECT
+            for slot, attr in enumerate(RGBA_ATTRS):
+                row[4 + 2 * slot:6 + 2 * slot] = rgbas.push(getattr(mob, attr))
+        elif isinstance(mob, ImageMobject):
+            row[1] = NODE_IMAGE
+            row[10] = len(image_shapes)
+            image_shapes.append(mob.pixel_array.shape)
+            row[11] = pixels.push(mob.pixel_array.ravel())[0]
+        nodes.append(row)
+        scalars.append([getattr(mob, "stroke_width", 0.0), getattr(mob, "background_stroke_width", 0.0), mob.z_index])
+        for submob in mob.submobjects:
+            visit(submob, index)
+
+    for mob in mobjects:
+        visit(mob, -1)
+    return {
+        "nodes": np.array(nodes, dtype=np.int64).reshape(-1, 12),
+        "scalars": np.array(scalars, dtype=np.float64).reshape(-1, 3),
+        "points": points.array(),
+        "rgbas": rgbas.array(),
+        "pixels": pixels.array().ravel(),
+        "image_shapes": np.array(image_shapes, dtype=np.int64).reshape(-1, 3),
+    }
+
+def deserialize_mobjects(arrays):
+    """Rebuild the top-level mobjects from :func:`serialize_mobjects` output as
+    plain ``VMobject``/``ImageMobject``/``Group`` trees with identical geometry
+    and style."""
+    nodes, scalars = arrays["nodes"], arrays["scalars"]
+    rebuilt, roots = [], []
+    for row, (stroke_width, background_stroke_width, z_index) in zip(nodes, scalars):
+        parent, kind = row[0], row[1]
+        if kind == NODE_IMAGE:
+            shape = tuple(arrays["image_shapes"][row[10]])
+            mob = ImageMobject(arrays["pixels"][row[11]:row[11] + np.prod(shape)].reshape(shape))
+        elif kind == NODE_VMOBJECT:
+            mob = VMobject()
+            for slot, attr in enumerate(RGBA_ATTRS):
+                setattr(mob, attr, arrays["rgbas"][row[4 + 2 * slot]:row[5 + 2 * slot]].copy())
+            mob.stroke_width = stroke_width
+            mob.background_stroke_width = background_stroke_width
+        else:
+            mob = Group()
+        mob.points = arrays["points"][row[2]:row[3]].copy()
+        mob.z_index = z_index
+        rebuilt.append(mob)
+        if parent < 0:
+            roots.append(mob)
+        else:
+            rebuilt[parent].submobjects.append(mob)
+    return roots
+
+def _rng_state_arrays():
+    version, mt_state, gauss = random.getstate()
+    np_name, np_keys, np_pos, np_has_gauss, np_gauss = np.random.get_state()
+    arrays = {"python_rng": np.array(mt_state, dtype=np.uint64), "numpy_rng": np.asarray(np_keys, dtype=np.uint32)}
+    meta = {"python_rng": [version, gauss], "numpy_rng": [np_name, int(np_pos), int(np_has_gauss), float(np_gauss)]}
+    return arrays, meta
+
+def sidecar_path(path):
+    return os.path.splitext(path)[0] + ".json"
+
+def save_snapshot(scene, path):
+    """Write the clock, camera background and RNG state a section boundary
+    needs to ``path``, with the small metadata in a JSON sidecar written last
+    so choosing a snapshot never opens the archive. The next section starts
+    from an empty scene, so the mobject graph is not stored."""
+    rng_arrays, rng_meta = _rng_state_arrays()
+    meta = {
+        "time": scene.renderer.time,
+        "num_plays": scene.renderer.num_plays,
+        "background_color": ManimColor(scene.camera.background_color).to_hex(),
+        "background_opacity": scene.camera.background_opacity,
+        **rng_meta,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez(path, **rng_arrays)
+    with open(sidecar_path(path), "w") as f:
+        json.dump(meta, f)
+
+def load_snapshot_meta(path):
+    """Sidecar metadata of a snapshot, or ``None`` if it was never completed."""
+    try:
+        with open(sidecar_path(path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def restore_snapshot(scene, path):
+    meta = load_snapshot_meta(path)
+    with np.load(path) as data:
+        python_rng, numpy_rng = data["python_rng"], data["numpy_rng"]
+    scene.renderer.time = meta["time"]
+    scene.renderer.num_plays = meta["num_plays"]
+    scene.camera.background_color = ManimColor(meta["background_color"])
+    scene.camera.background_opacity = meta["background_opacity"]
+    version, gauss = meta["python_rng"]
+    random.setstate((version, tuple(int(v) for v in python_rng), gauss))
+    np_name, np_pos, np_has_gauss, np_gauss = meta["numpy_rng"]
+    np.random.set_state((np_name, numpy_rng, np_pos, np_has_gauss, np_gauss))
+    return meta
+
+def section_snapshot_paths(sections, snapshot_dir=SNAPSHOT_DIR):
+    """One snapshot path per section boundary, keyed by the chained fingerprints
+    of every section up to it so stale snapshots are never restored."""
+    fingerprinter = SceneFingerprinter(os.path.dirname(os.path.abspath(__file__)))
+    key, paths = "", []
+    for index, section in enumerate(sections):
+        key = hashlib.sha256((key + fingerprinter.fingerprint_scene(section)).encode()).hexdigest()
+        paths.append(os.path.join(snapshot_dir, f"{index:02d}_{section.__name__}_{key[:16]}.npz"))
+    return paths
+
+def restore_nearest_snapshot(scene, paths, before_time):
+    """Restore the latest boundary snapshot taken at or before ``before_time``
+    and return the index of the first section that still has to run."""
+    for index in reversed(range(len(paths))):
+        meta = load_snapshot_meta(paths[index])
+        if meta is not None and meta["time"] <= before_time:
+            restore_snapshot(scene, paths[index])
+            return index + 1
+    return 0
@@ -0,0 +1,113 @@
+import numpy as np
+
+from measurement_sampling import check_coprime_base
+from order_tables import multiplicative_order
+
+MAX_REGISTER_BITS = 62
+DEFAULT_HALF_WIDTH = 16
+DEFAULT_BATCH = 1 << 16
+
+def _sin2(v, Q):
+    """``sin(pi * v / Q) ** 2`` for unsigned ``v < Q``, taken from the signed
+    distance to 0 (mod Q) so it stays accurate next to the peaks."""
+    signed = v.astype(np.int64)
+    signed = np.where(signed > Q // 2, signed - Q, signed)
+    return np.sin(np.pi * signed / Q) ** 2
+
+def outcome_probabilities(y, r, n_count):
+    """Exact probability of each counting-register outcome ``y`` for period ``r``.
+
+    The ``2**n_count`` inputs split into ``r`` arithmetic progressions
+    ``x0 + k r`` (``s = Q mod r`` of them one term longer), and after the QFT
+    each contributes a geometric sum, ``|sum_k e^(2 pi i y k r / Q)|**2 =
+    sin^2(M theta) / sin^2(theta)`` with ``theta = pi (y r mod Q) / Q``. All
+    products are reduced mod ``Q = 2**n_count`` through uint64 wraparound, so
+    the phases are exact up to 62 qubits; no amplitudes are stored."""
+    if n_count > MAX_REGISTER_BITS:
+        raise ValueError(f"registers above {MAX_REGISTER_BITS} qubits are not supported")
+    Q = 1 << n_count
+    q, s = divmod(Q, r)
+    mask = np.uint64(Q - 1)
+    y = np.asarray(y)
+    flat = y.astype(np.uint64).reshape(-1)
+    u = flat * np.uint64(r) & mask
+    long_runs = _sin2(u * np.uint64(q + 1) & mask, Q)
+    short_runs = _sin2(u * np.uint64(q) & mask, Q)
+    denominator = _sin2(u, Q)
+    on_peak = u == 0
+    probabilities = (s * long_runs + (r - s) * short_runs) / np.where(on_peak, 1.0, denominator) / float(Q) ** 2
+    probabilities[on_peak] = (s * (q + 1) ** 2 + (r - s) * q ** 2) / float(Q) ** 2
+    return probabilities.reshape(y.shape)
+
+def peak_centers(r, n_count):
+    """Nearest outcome to every ideal peak ``j Q / r``, and its exact offset
+    ``c_j r - j Q``."""
+    Q = 1 << n_count
+    centers = [(j * Q + r // 2) // r for j in range(r)]
+    return np.array(centers, dtype=np.int64), np.array([c * r - j * Q for j, c in enumerate(centers)], dtype=np.int64)
+
+def windowed_distribution(r, n_count, half_width=DEFAULT_HALF_WIDTH):
+    """Outcomes within ``half_width`` of every peak and their exact
+    probabilities; the whole register when the windows would overlap."""
+    Q = 1 << n_count
+    if Q <= r * (2 * half_width + 1):
+        y = np.arange(Q, dtype=np.int64)
+    else:
+        centers, _ = peak_centers(r, n_count)
+        y = ((centers[:, None] + np.arange(-half_width, half_width + 1)[None, :]) % Q).ravel()
+    return y, outcome_probabilities(y, r, n_count)
+
+class OutcomeSampler:
+    """Draws outcomes from the exact distribution without enumerating it.
+
+    Outcomes inside the peak windows are drawn from their tabulated
+    probabilities. The remaining tail mass (a few percent) is drawn by
+    rejection from a Pareto-shaped proposal around a random peak, using the
+    bound ``P(y) <= 1 / (4 r (|d| - 1/2)**2)`` at distance ``d`` from the
+    peak, so tail samples are exact too."""
+    def __init__(self, r, n_count, half_width=DEFAULT_HALF_WIDTH, seed=None):
+        self.r, self.n_count, self.half_width = r, n_count, half_width
+        self.Q = 1 << n_count
+        self.rng = np.random.default_rng(seed)
+        self.window_y, self.window_p = windowed_distribution(r, n_count, half_width)
+        self.window_mass = min(float(self.window_p.sum()), 1.0)
+        self.window_cdf = np.cumsum(self.window_p) / self.window_p.sum()
+        self.centers, self.center_offsets = peak_centers(r, n_count)
+
+    def _sample_tail(self, count):
+        W, r, Q = self.half_width, self.r, self.Q
+        envelope = (W + 2) / (2 * (W + 0.5) ** 2)
+        accepted = []
+        while count > 0:
+            n = max(4 * count, 256)
+            j = self.rng.integers(r, size=n)
+            distance = np.minimum(np.floor((W + 1) / (1 - self.rng.random(n))), Q // r + 1).astype(np.int64)
+            d = distance * self.rng.choice(np.array([-1, 1]), size=n)
+            nearest = np.abs(d * r + self.center_offsets[j]) * 2 <= Q
+            y = (self.centers[j] + d) % Q
+            proposal = (W + 1) / (2.0 * r * distance * (distance + 1.0))
+            accept = nearest & (self.rng.random(n) * envelope * proposal < outcome_probabilities(y, r, self.n_count))
+            chosen = y[accept][:count]
+            accepted.append(chosen)
+            count -= len(chosen)
+        return np.concatenate(accepted) if accepted else np.zeros(0, dtype=np.int64)
+
+    def sample(self, shots):
+        in_window = self.rng.binomial(shots, self.window_mass)
+        index = np.minimum(np.searchsorted(self.window_cdf, self.rng.random(in_window), side="right"), len(self.window_y) - 1)
+        outcomes = np.concatenate([self.window_y[index], self._sample_tail(shots - in_window)])
+        self.rng.shuffle(outcomes)
+        return outcomes
+
+    def batches(self, shots, batch_size=DEFAULT_BATCH):
+        """Yield ``shots`` outcomes in batches, for streaming into a scene."""
+        while shots > 0:
+            size = min(shots, batch_size)
+            yield self.sample(size)
+            shots -= size
+
+def sample_register(N, a, n_count, shots, seed=None, half_width=DEFAULT_HALF_WIDTH):
+    """``shots`` counting-register outcomes of period finding for ``a^x mod N``."""
+    check_coprime_base(N, a)
+    sampler = OutcomeSampler(multiplicative_order(N, a), n_count, half_width, seed)
+    return np.concatenate(list(sampler.batches(shots))) if shots else np.zeros(0, dtype=np.int64)
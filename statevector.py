@@ -0,0 +1,90 @@
+from manim import *
+import numpy as np
+
+from histogram import MeasurementHistogram
+from measurement_sampling import modular_powers
+
+class ShorStatevector:
+    """Exact state of Shor's period finding for ``a^x mod N``.
+
+    The state is a dense ``(2**n_count, N)`` complex array: one row per
+    counting-register value, one column per work-register residue, which is
+    all the modular exponentiation can ever reach. Every stage is one numpy
+    operation on the whole array."""
+    def __init__(self, N, a, n_count):
+        self.N, self.a, self.n_count = N, a, n_count
+        self.size = 1 << n_count
+        self.amplitudes = np.zeros((self.size, N), dtype=np.complex128)
+        self.amplitudes[0, 1 % N] = 1
+
+    def hadamards(self):
+        column = self.amplitudes[0].copy()
+        self.amplitudes[:] = column[None, :] / np.sqrt(self.size)
+        return self.amplitudes
+
+    def modular_exponentiation(self):
+        """``|x>|y> -> |x>|y * a^x mod N>`` as one scatter over all rows; with
+        ``gcd(a, N) == 1`` each row is a permutation of the residues."""
+        x = np.arange(self.size)
+        targets = np.arange(self.N)[None, :] * modular_powers(self.a, x, self.N)[:, None] % self.N
+        result = np.zeros_like(self.amplitudes)
+        result[x[:, None], targets] = self.amplitudes
+        self.amplitudes = result
+        return self.amplitudes
+
+    def qft(self):
+        self.amplitudes = np.fft.fft(self.amplitudes, axis=0) / np.sqrt(self.size)
+        return self.amplitudes
+
+    def stages(self):
+        """Yield ``(name, amplitudes)`` for the initial state and after each stage,
+        computing every stage only when it is asked for."""
+        yield "initial", self.amplitudes.copy()
+        for name, stage in (("hadamard", self.hadamards), ("modexp", self.modular_exponentiation), ("qft", self.qft)):
+            yield name, stage().copy()
+
+def register_probabilities(amplitudes, work_value=None):
+    """Counting-register probabilities of a ``(2**n, N)`` state, either summed
+    over the work register or conditioned on it reading ``work_value``."""
+    weights = np.abs(amplitudes if work_value is None else amplitudes[:, work_value]) ** 2
+    if weights.ndim == 2:
+        weights = weights.sum(axis=1)
+    total = weights.sum()
+    return weights / total if total > 0 else weights
+
+class RegisterView(MeasurementHistogram):
+    """Counting-register histogram driven by statevector amplitudes. With
+    ``work_value`` the view shows the register after the work register has been
+    read as that value; with ``auto_scale`` the tallest bar always fills the
+    chart, so a uniform 2**10-state superposition is as readable as a few peaks."""
+    def __init__(self, amplitudes, work_value=None, auto_scale=True, **kwargs):
+        self.work_value, self.auto_scale = work_value, auto_scale
+        self.amplitudes = np.asarray(amplitudes)
+        probabilities = register_probabilities(self.amplitudes, work_value)
+        super().__init__(probabilities, **kwargs)
+
+    def set_amplitudes(self, amplitudes):
+        self.amplitudes = amplitudes
+        heights = register_probabilities(amplitudes, self.work_value)
+        if self.auto_scale:
+            self.max_value = max(heights.max(), 1e-12)
+        return self.set_heights(heights)
+
+class StageTransition(Animation):
+    """Move a :class:`RegisterView` to the amplitudes of the next stage. Every
+    frame blends the two complex states linearly and renormalizes in one
+    vectorized step, so interference shows up as bars grow and cancel."""
+    def __init__(self, register_view, target_amplitudes, **kwargs):
+        self.target_amplitudes = np.asarray(target_amplitudes)
+        super().__init__(register_view, **kwargs)
+
+    def begin(self):
+        self.start_amplitudes = self.mobject.amplitudes
+        super().begin()
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_amplitudes((1 - t) * self.start_amplitudes + t * self.target_amplitudes)
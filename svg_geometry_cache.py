@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+
+from manim import *
+import numpy as np
+
+GEOMETRY_CACHE_DIR = os.path.join("media", "svg_geometry")
+GEOMETRY_FORMAT = 2
+TABLE_COLUMNS = 4
+
+_original_generate_mobject = None
+
+def geometry_key(svg_mobject):
+    """Content hash of the SVG file plus everything that influences how
+    ``generate_mobject`` parses it."""
+    digest = hashlib.sha256(svg_mobject.get_file_path().read_bytes())
+    digest.update(repr((GEOMETRY_FORMAT, type(svg_mobject).__name__, svg_mobject.svg_default, svg_mobject.path_string_config, config.renderer)).encode())
+    return digest.hexdigest()
+
+def _blob_paths(key, cache_dir):
+    return tuple(os.path.join(cache_dir, f"{key}_{name}") for name in ("points.npy", "rgbas.npy", "ids.json", "table.npy"))
+
+def _atomic_save(path, array):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(temp_path, path)
+
+def save_geometry(key, mobjects, id_groups=None, cache_dir=GEOMETRY_CACHE_DIR):
+    """Store the parsed paths as one points array, one RGBA array holding every
+    path's fill rows then stroke rows, and one row per path holding the end
+    offsets into both and its stroke width. ``id_groups`` maps SVG ids to
+    indices into ``mobjects``. The table is written last and marks the entry
+    complete for concurrent readers."""
+    os.makedirs(cache_dir, exist_ok=True)
+    points_path, rgbas_path, ids_path, table_path = _blob_paths(key, cache_dir)
+    rgbas = [rgba for mob in mobjects for rgba in (mob.fill_rgbas, mob.stroke_rgbas)]
+    table = np.zeros((len(mobjects), TABLE_COLUMNS))
+    table[:, 0] = np.cumsum([len(mob.points) for mob in mobjects])
+    rgba_ends = np.cumsum([len(rgba) for rgba in rgbas]).reshape(-1, 2)
+    table[:, 1:3] = rgba_ends if len(rgba_ends) else np.zeros((0, 2))
+    table[:, 3] = [mob.stroke_width for mob in mobjects]
+    _atomic_save(points_path, np.concatenate([mob.points for mob in mobjects]) if mobjects else np.zeros((0, 3)))
+    _atomic_save(rgbas_path, np.concatenate(rgbas) if rgbas else np.zeros((0, 4)))
+    with open(f"{ids_path}.{os.getpid()}.tmp", "w") as f:
+        json.dump(id_groups, f)
+    os.replace(f"{ids_path}.{os.getpid()}.tmp", ids_path)
+    _atomic_save(table_path, table)
+
+def load_geometry(key, cache_dir=GEOMETRY_CACHE_DIR):
+    """Rebuild the paths of a cached SVG and its id mapping, or ``None`` on a
+    miss. The points are memory-mapped copy-on-write, so every path's points
+    are a view into pages shared with other render processes until a
+    transform writes to them."""
+    points_path, rgbas_path, ids_path, table_path = _blob_paths(key, cache_dir)
+    if not os.path.exists(table_path):
+        return None
+    table = np.load(table_path)
+    with open(ids_path) as f:
+        id_groups = json.load(f)
+    if not len(table):
+        return [], id_groups
+    points = np.load(points_path, mmap_mode="c")
+    rgbas = np.load(rgbas_path)
+    mobjects, start, rgba_start = [], 0, 0
+    for row in table:
+        end, fill_end, stroke_end = (int(v) for v in row[:3])
+        mob = VMobject()
+        mob.points = points[start:end]
+        mob.fill_rgbas = rgbas[rgba_start:fill_end].copy()
+        mob.stroke_rgbas = rgbas[fill_end:stroke_end].copy()
+        mob.stroke_width = row[3]
+        mobjects.append(mob)
+        start, rgba_start = end, stroke_end
+    return mobjects, id_groups
+
+def _id_groups(svg_mobject):
+    """``id -> indices into submobjects`` for the SVG's ``id_to_vgroup_dict``,
+    or ``None`` when this manim version does not build one."""
+    id_to_vgroup = getattr(svg_mobject, "id_to_vgroup_dict", None)
+    if id_to_vgroup is None:
+        return None
+    index = {id(mob): i for i, mob in enumerate(svg_mobject.submobjects)}
+    return {
+        name: [index[id(mob)] for mob in group.get_family() if id(mob) in index]
+        for name, group in id_to_vgroup.items()
+    }
+
+def _cached_generate_mobject(self):
+    key = geometry_key(self)
+    cached = load_geometry(key)
+    if cached is None:
+        _original_generate_mobject(self)
+        save_geometry(key, self.submobjects, _id_groups(self))
+        return
+    mobjects, id_groups = cached
+    self.add(*mobjects)
+    if id_groups is not None:
+        self.id_to_vgroup_dict = {name: VGroup(*(mobjects[i] for i in indices)) for name, indices in id_groups.items()}
+
+def install():
+    """Route ``SVGMobject.generate_mobject`` (used by ``Text``, ``MathTex`` and
+    ``SVGMobject``) through the on-disk geometry cache."""
+    global _original_generate_mobject
+    if _original_generate_mobject is None:
+        _original_generate_mobject = SVGMobject.generate_mobject
+        SVGMobject.generate_mobject = _cached_generate_mobject
@@ -0,0 +1,85 @@
+from manim import *
+import numpy as np
+
+from atlas_math import math_tex
+
+class TemplatedMathTex(VGroup):
+    """Math built from a ``str.format`` template whose fields can change.
+
+    ``template`` is TeX with ``{name}`` slots (literal braces doubled, as in
+    ``str.format``). :meth:`set_fields` re-lays out the string from the glyph
+    atlas and rewrites the points of a pool of glyph mobjects in place, so a
+    new value costs neither a LaTeX run nor new submobjects. ``edge_to_fix``
+    stays put when the width changes."""
+    def __init__(self, template, font_size=DEFAULT_FONT_SIZE, color=WHITE, edge_to_fix=ORIGIN, **fields):
+        super().__init__()
+        self.template, self.font_size, self.glyph_color, self.edge_to_fix = template, font_size, color, edge_to_fix
+        self.fields, self.tex_string = {}, None
+        self.set_fields(**fields)
+
+    def get_tex_string(self):
+        return self.template.format(**self.fields)
+
+    def set_fields(self, **fields):
+        self.fields.update(fields)
+        tex_string = self.get_tex_string()
+        if tex_string == self.tex_string:
+            return self
+        self.tex_string = tex_string
+        anchor = self.get_critical_point(self.edge_to_fix) if self.submobjects else None
+        rendered = math_tex(tex_string, font_size=self.font_size, color=self.glyph_color)
+        glyphs = rendered.family_members_with_points()
+        while len(self.submobjects) < len(glyphs):
+            self.add(VMobject())
+        self.remove(*self.submobjects[len(glyphs):])
+        for glyph, source in zip(self.submobjects, glyphs):
+            glyph.set_points(source.points)
+            glyph.match_style(source)
+        if anchor is not None:
+            self.move_to(anchor, aligned_edge=self.edge_to_fix)
+        return self
+
+class ChangeFields(Animation):
+    """Animate a :class:`TemplatedMathTex` to new field values. Numeric fields
+    count towards their targets like ``ChangeDecimalToValue`` (integers stay
+    integers); with ``counting=False`` the values switch at the midpoint while
+    the text briefly dips in opacity, relative to each glyph's own opacity."""
+    def __init__(self, templated_tex, target_fields, counting=True, **kwargs):
+        self.target_fields = dict(target_fields)
+        self.counting = counting
+        super().__init__(templated_tex, **kwargs)
+
+    def begin(self):
+        self.start_fields = {key: self.mobject.fields.get(key) for key in self.target_fields}
+        self.glyph_opacities = [glyph.get_fill_opacity() for glyph in self.mobject.family_members_with_points()]
+        super().begin()
+
+    def set_glyph_opacities(self, factor):
+        glyphs = self.mobject.family_members_with_points()
+        self.glyph_opacities += [glyph.get_fill_opacity() for glyph in glyphs[len(self.glyph_opacities):]]
+        for glyph, opacity in zip(glyphs, self.glyph_opacities):
+            glyph.set_fill(opacity=opacity * factor)
+
+    def finish(self):
+        super().finish()
+        if not self.counting:
+            self.set_glyph_opacities(1)
+
+    def create_starting_mobject(self):
+        return Mobject()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        if self.counting:
+            fields = {}
+            for key, target in self.target_fields.items():
+                start = self.start_fields[key]
+                if isinstance(start, (int, float, np.number)) and isinstance(target, (int, float, np.number)):
+                    value = interpolate(start, target, t)
+                    fields[key] = int(round(value)) if isinstance(target, (int, np.integer)) else value
+                else:
+                    fields[key] = target if t >= 0.5 else start
+            self.mobject.set_fields(**fields)
+            return
+        self.mobject.set_fields(**(self.target_fields if t >= 0.5 else self.start_fields))
+        self.set_glyph_opacities(abs(1 - 2 * t))
@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+import classical_factoring
+from classical_factoring import quadratic_sieve, random_semiprime
+
+@pytest.mark.parametrize("bits", [56, 64, 72, 80, 92])
+def test_quadratic_sieve_factors_without_fallback(bits, monkeypatch):
+    def no_fallback(*args, **kwargs):
+        raise AssertionError("quadratic_sieve fell back to pollard_rho")
+    monkeypatch.setattr(classical_factoring, "pollard_rho", no_fallback)
+    for seed in range(3):
+        n = random_semiprime(bits, random.Random(seed))
+        factor = quadratic_sieve(n)
+        assert 1 < factor < n and n % factor == 0
+
+def test_time_factoring_rejects_bad_factor(monkeypatch):
+    monkeypatch.setitem(classical_factoring.FACTORING_METHODS, "quadratic_sieve", lambda n: 1)
+    with pytest.raises(RuntimeError):
+        classical_factoring._time_factoring(("quadratic_sieve", 56, 0))
+
+def test_benchmark_cache_is_keyed_by_code_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(classical_factoring, "run_benchmark", lambda **kwargs: classical_factoring.BenchmarkResult(machine="m", timings={}))
+    monkeypatch.setattr(classical_factoring.BenchmarkResult, "fit", lambda self: self)
+    classical_factoring.load_or_run_benchmark(cache_dir=str(tmp_path))
+    [path] = tmp_path.iterdir()
+    assert classical_factoring.code_version() in path.name
@@ -0,0 +1,18 @@
+import runpy
+import sys
+import types
+
+import localization
+
+def test_strings_used_by_reads_the_module_scenes_import(monkeypatch):
+    monkeypatch.setitem(sys.modules, "frame_render", types.SimpleNamespace(replay_scene=lambda scene_cls: scene_cls.construct()))
+    # A separate copy of the file, as when it runs as ``python localization.py``.
+    cli = runpy.run_path(localization.__file__, run_name="localization_cli")
+    assert cli["STRING_USAGE"] is not localization.STRING_USAGE
+
+    class Scene:
+        @staticmethod
+        def construct():
+            localization.tr("Shor's algorithm")
+
+    assert cli["strings_used_by"](Scene) == {"Shor's algorithm"}
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from manim import BLUE, RED, Circle, Group, ImageMobject, Square, VGroup
+
+from scene_snapshots import deserialize_mobjects, serialize_mobjects
+
+def test_non_empty_scene_round_trips():
+    pixels = np.zeros((4, 6, 4), dtype=np.uint8)
+    pixels[1:3, 2:5] = (255, 128, 0, 200)
+    shapes = VGroup(Square(color=RED).set_fill(BLUE, opacity=0.5), Circle(stroke_width=7).shift(2 * np.array([1, 0, 0])))
+    image = ImageMobject(pixels).set_z_index(3)
+    mobjects = [shapes, Group(image)]
+    restored = deserialize_mobjects(serialize_mobjects(mobjects))
+    assert len(restored) == 2
+    originals = [m for mob in mobjects for m in mob.get_family()]
+    copies = [m for mob in restored for m in mob.get_family()]
+    assert len(copies) == len(originals) > 2
+    for original, copy in zip(originals, copies):
+        np.testing.assert_allclose(copy.points, original.points)
+        assert copy.z_index == original.z_index
+        for attr in ("fill_rgbas", "stroke_rgbas"):
+            if hasattr(original, attr):
+                np.testing.assert_allclose(getattr(copy, attr), getattr(original, attr))
+        if hasattr(original, "stroke_width") and hasattr(original, "fill_rgbas"):
+            assert copy.stroke_width == original.stroke_width
+    np.testing.assert_array_equal(copies[-1].pixel_array, image.pixel_array)
+
+def test_boundary_snapshot_restores_clock_and_rng(tmp_path):
+    import random
+    from types import SimpleNamespace
+
+    from scene_snapshots import load_snapshot_meta, restore_nearest_snapshot, save_snapshot
+
+    def make_scene(time):
+        return SimpleNamespace(renderer=SimpleNamespace(time=time, num_plays=7), camera=SimpleNamespace(background_color="#1A1A1A", background_opacity=1.0))
+
+    path = str(tmp_path / "00_Intro.npz")
+    random.seed(5); np.random.seed(5)
+    save_snapshot(make_scene(12.5), path)
+    expected = (random.random(), np.random.random())
+    assert load_snapshot_meta(path)["time"] == 12.5
+    scene = make_scene(0.0)
+    assert restore_nearest_snapshot(scene, [path], before_time=10.0) == 0
+    assert restore_nearest_snapshot(scene, [path], before_time=20.0) == 1
+    assert (scene.renderer.time, scene.renderer.num_plays) == (12.5, 7)
+    assert (random.random(), np.random.random()) == expected
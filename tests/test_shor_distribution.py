@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from measurement_sampling import register_distribution, sample_period_finding
+from shor_distribution import sample_register
+
+def test_non_coprime_base_is_rejected():
+    with pytest.raises(ValueError, match="base 6 is not coprime to 15"):
+        sample_register(15, 6, 40, 16, seed=0)
+    with pytest.raises(ValueError, match="base 6 is not coprime to 15"):
+        register_distribution(15, 6, 8)
+    with pytest.raises(ValueError, match="not coprime"):
+        sample_period_finding(21, 14, n_count=30, shots=16, seed=0)
+
+def test_sampled_outcomes_cluster_on_peaks():
+    outcomes = sample_register(15, 7, 40, 4096, seed=0)
+    distance = np.abs(((outcomes + (1 << 37)) % (1 << 38)) - (1 << 37))
+    assert len(outcomes) == 4096 and (distance <= 16).mean() > 0.9
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("PIL")
+pytest.importorskip("scipy")
+
+import visual_regression
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+@pytest.mark.parametrize("scene_name", sorted(visual_regression.KEY_FRAMES))
+def test_key_frames_match_references(scene_name, monkeypatch):
+    monkeypatch.chdir(PROJECT_DIR)
+    drifted = visual_regression.run("video.py", [scene_name])
+    assert not drifted, "\n".join(
+        f"{scene} @ {t:.2f}s: " + ("missing reference" if distance is None else f"phash {distance}, SSIM {similarity:.4f}")
+        for scene, t, distance, similarity in drifted
+    )
+
+def test_missing_reference_is_a_failure(monkeypatch, tmp_path):
+    monkeypatch.setattr(visual_regression, "REFERENCE_DIR", tmp_path)
+    monkeypatch.setattr(visual_regression, "render_key_frames", lambda module, scene_name, times: {t: None for t in times})
+    monkeypatch.setattr(visual_regression, "load_scene_module", lambda path: None)
+    drifted = visual_regression.run("video.py", ["OutroScene"])
+    assert [(scene, distance) for scene, _, distance, _ in drifted] == [("OutroScene", None)] * len(visual_regression.KEY_FRAMES["OutroScene"])
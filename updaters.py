@@ -0,0 +1,150 @@
+import argparse
+import contextlib
+import inspect
+import time
+from collections import defaultdict
+
+from manim import *
+import numpy as np
+
+from frame_render import SeekRenderer
+from render_cache import load_scene_module
+
+class UpdaterProfiler:
+    """Times every mobject updater call and aggregates the cost per updater
+    and per frame, where a frame is one ``Scene.update_mobjects`` step."""
+    def __init__(self):
+        self.calls = defaultdict(int)
+        self.total = defaultdict(float)
+        self.worst_frame = defaultdict(float)
+        self.frames = defaultdict(int)
+        self.frame_cost = defaultdict(float)
+        self.takes_dt = {}
+
+    def describe(self, mobject, updater):
+        code = getattr(updater, "__code__", None) or getattr(type(updater).__call__, "__code__", None)
+        where = f" ({code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno})" if code else ""
+        return f"{type(mobject).__name__}: {getattr(updater, '__qualname__', type(updater).__name__)}{where}"
+
+    def update(self, mobject, dt=0, recursive=True):
+        if mobject.updating_suspended:
+            return mobject
+        for updater in mobject.updaters:
+            if updater not in self.takes_dt:
+                self.takes_dt[updater] = "dt" in inspect.signature(updater).parameters
+            start = time.perf_counter()
+            if self.takes_dt[updater]:
+                updater(mobject, dt)
+            else:
+                updater(mobject)
+            key = self.describe(mobject, updater)
+            self.calls[key] += 1
+            self.frame_cost[key] += time.perf_counter() - start
+        if recursive:
+            for submob in mobject.submobjects:
+                submob.update(dt, recursive)
+        return mobject
+
+    def end_frame(self):
+        for key, cost in self.frame_cost.items():
+            self.total[key] += cost
+            self.frames[key] += 1
+            self.worst_frame[key] = max(self.worst_frame[key], cost)
+        self.frame_cost.clear()
+
+    @contextlib.contextmanager
+    def active(self):
+        profiler = self
+        original_update, original_update_mobjects = Mobject.update, Scene.update_mobjects
+
+        def update_mobjects(scene, dt):
+            original_update_mobjects(scene, dt)
+            profiler.end_frame()
+
+        Mobject.update = lambda mob, dt=0, recursive=True: profiler.update(mob, dt, recursive)
+        Scene.update_mobjects = update_mobjects
+        try:
+            yield self
+        finally:
+            Mobject.update, Scene.update_mobjects = original_update, original_update_mobjects
+
+    def report(self, limit=10):
+        rows = sorted(self.total, key=self.total.get, reverse=True)[:limit]
+        lines = [f"{'updater':<72} {'calls':>7} {'ms/frame':>9} {'worst ms':>9}"]
+        lines += [
+            f"{key[:72]:<72} {self.calls[key]:>7} {1e3 * self.total[key] / self.frames[key]:>9.3f} {1e3 * self.worst_frame[key]:>9.3f}"
+            for key in rows
+        ]
+        return "\n".join(lines)
+
+def profile_scene(scene_cls):
+    """Step ``scene_cls`` frame by frame, running every updater but drawing and
+    encoding nothing, and return the filled :class:`UpdaterProfiler`."""
+    profiler = UpdaterProfiler()
+    with tempconfig({"write_to_movie": False, "save_last_frame": False, "disable_caching": True}):
+        renderer = SeekRenderer()
+        renderer.skip_animations = renderer._original_skipping_status = False
+        scene = scene_cls(renderer=renderer)
+        with profiler.active():
+            scene.render()
+    return profiler
+
+class RigidUpdater:
+    """Fast-path updater for motion that is only a linear map plus a shift of
+    fixed geometry. The family's points are captured once into one buffer
+    (each member's ``points`` becomes a view of it) and every frame is a single
+    matrix product; styles, tips and the family list are never rebuilt.
+    ``transform(dt)`` returns ``(matrix, shift)``."""
+    def __init__(self, mobject, transform):
+        members = mobject.family_members_with_points()
+        self.base = np.concatenate([member.points for member in members])
+        self.buffer = self.base.copy()
+        start = 0
+        for member in members:
+            member.points = self.buffer[start:start + len(member.points)]
+            start += len(member.points)
+        self.transform = transform
+
+    def __call__(self, mobject, dt):
+        matrix, shift = self.transform(dt)
+        np.add(self.base @ np.asarray(matrix).T, shift, out=self.buffer)
+
+def add_rigid_updater(mobject, transform):
+    updater = RigidUpdater(mobject, transform)
+    mobject.add_updater(updater)
+    return updater
+
+def aim_transform(pivot, base_end, get_target):
+    """Rotation and uniform scale about ``pivot`` carrying ``base_end`` onto
+    ``get_target()``: the rigid equivalent of ``put_start_and_end_on`` for a
+    line whose base geometry ends at ``base_end``. Not for arrows: their tip
+    keeps its size under ``put_start_and_end_on`` but would scale here."""
+    pivot = np.asarray(pivot, dtype=np.float64)
+    base = np.asarray(base_end, dtype=np.float64) - pivot
+    base_length = np.linalg.norm(base)
+    base_unit = base / base_length
+
+    def transform(dt):
+        target = np.asarray(get_target(), dtype=np.float64) - pivot
+        length = np.linalg.norm(target)
+        unit = target / length if length > 0 else base_unit
+        axis, cos = np.cross(base_unit, unit), np.dot(base_unit, unit)
+        if cos < -1 + 1e-9:
+            perpendicular = np.cross(base_unit, OUT if abs(base_unit[2]) < 0.9 else RIGHT)
+            perpendicular /= np.linalg.norm(perpendicular)
+            rotation = 2 * np.outer(perpendicular, perpendicular) - np.eye(3)
+        else:
+            cross = np.array([[0, -axis[2], axis[1]], [axis[2], 0, -axis[0]], [-axis[1], axis[0], 0]])
+            rotation = np.eye(3) + cross + cross @ cross / (1 + cos)
+        matrix = rotation * (length / base_length)
+        return matrix, pivot - matrix @ pivot
+    return transform
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the mobject updaters of a scene frame by frame.")
+    parser.add_argument("file", nargs="?", default="video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("--top", type=int, default=10, help="number of updaters to list")
+    args = parser.parse_args()
+    module = load_scene_module(args.file)
+    print(profile_scene(getattr(module, args.scene)).report(args.top))
@@ -0,0 +1,262 @@
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+
+from manim import *
+import numpy as np
+from PIL import Image
+
+from frame_render import SeekRenderer
+from render_cache import load_scene_module
+
+VECTOR_DIR = os.path.join("media", "vector")
+PATH_PRECISION = 1e-4
+CIRCLE_PATH = "M0.5 0A0.5 0.5 0 1 1-0.5 0A0.5 0.5 0 1 1 0.5 0Z"
+
+PLAYER_JS = """
+const NS = "http://www.w3.org/2000/svg";
+function play(svg, anim) {
+  const [cx, cy] = anim.center, w = anim.frame_width, h = anim.frame_height;
+  svg.setAttribute("viewBox", `${cx - w / 2} ${-cy - h / 2} ${w} ${h}`);
+  const defs = document.createElementNS(NS, "defs"), layer = document.createElementNS(NS, "g");
+  anim.paths.forEach((d, i) => {
+    const path = document.createElementNS(NS, "path");
+    path.id = "p" + i; path.setAttribute("d", d); defs.appendChild(path);
+  });
+  svg.append(defs, layer);
+  let nodes, state, index, frameEnd, start;
+  function reset(now) { nodes = {}; state = {}; index = 0; frameEnd = 0; start = now; layer.replaceChildren(); }
+  function apply(frame) {
+    for (const [id, attrs] of Object.entries(frame.s || {})) {
+      const s = state[id] = Object.assign(state[id] || {}, attrs);
+      let node = nodes[id];
+      if (!node) {
+        node = nodes[id] = document.createElementNS(NS, "i" in s ? "image" : "use");
+        if ("i" in s) { node.setAttribute("width", 1); node.setAttribute("height", 1); node.setAttribute("preserveAspectRatio", "none"); }
+      }
+      if ("i" in s) {
+        node.setAttribute("href", anim.images[s.i]);
+        node.setAttribute("transform", `matrix(${s.m.join(" ")})`);
+        node.setAttribute("opacity", s.o);
+      } else {
+        node.setAttribute("href", "#p" + s.p);
+        node.setAttribute("transform", `translate(${s.x} ${s.y}) scale(${s.k})`);
+        node.setAttribute("fill", s.f); node.setAttribute("fill-opacity", s.fo);
+        node.setAttribute("stroke", s.s); node.setAttribute("stroke-opacity", s.so);
+        node.setAttribute("stroke-width", s.w / s.k);
+      }
+    }
+    if (frame.o) layer.replaceChildren(...frame.o.map(id => nodes[id]));
+    if (frame.b) svg.style.background = frame.b;
+  }
+  function tick(now) {
+    if (start === undefined || index >= anim.frames.length && (now - start) / 1000 * anim.frame_rate >= frameEnd) reset(now);
+    const frame = (now - start) / 1000 * anim.frame_rate;
+    while (index < anim.frames.length && frame >= frameEnd) { apply(anim.frames[index]); frameEnd += anim.frames[index].n; index++; }
+    requestAnimationFrame(tick);
+  }
+  requestAnimationFrame(tick);
+}
+"""
+
+PLAYER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>body{{margin:0;background:#000}}svg{{width:100vw;height:100vh;display:block}}</style></head>
+<body><svg id="stage" xmlns="http://www.w3.org/2000/svg"></svg>
+<script>{player}</script>
+<script>play(document.getElementById("stage"), {data});</script>
+</body></html>
+"""
+
+def _hex(rgba):
+    return "#%02x%02x%02x" % tuple(int(round(255 * c)) for c in np.clip(rgba[:3], 0, 1))
+
+def _num(value, digits=4):
+    return round(float(value), digits)
+
+def path_data(subpaths):
+    """SVG path data for cubic Bezier subpaths given as (n, 2) arrays."""
+    parts = []
+    for subpath in subpaths:
+        curves = subpath.reshape(-1, 4, 2)
+        parts.append("M%.4g %.4g" % tuple(curves[0, 0]))
+        parts.extend("C%.4g %.4g %.4g %.4g %.4g %.4g" % tuple(curve[1:].ravel()) for curve in curves)
+        if np.allclose(curves[0, 0], curves[-1, 3]):
+            parts.append("Z")
+    return "".join(parts)
+
+class VectorRecorder:
+    """Collects frames as changes to a set of shared definitions.
+
+    Path geometry is normalized (centred, scaled to a unit box, y flipped into
+    SVG orientation) and stored once, so anything that only moves, scales or
+    fades keeps pointing at the same path. Each element then carries a small
+    attribute dict (path index, offset, scale, colours, opacities, stroke
+    width) and a frame only stores the attributes that differ from the
+    previous one, plus the draw order and background colour when they
+    change. Colour gradients are flattened to their first colour."""
+    def __init__(self, camera):
+        self.camera = camera
+        self.paths, self.path_index = [CIRCLE_PATH], {"circle": 0}
+        self.images, self.image_index = [], {}
+        self.element_ids = {}
+        self.frames, self.state, self.order, self.background = [], {}, None, None
+
+    def element_id(self, mobject, part=None):
+        key = (id(mobject), part)
+        if key not in self.element_ids:
+            self.element_ids[key] = (mobject, str(len(self.element_ids)))
+        return self.element_ids[key][1]
+
+    def add_path(self, subpaths):
+        key = (tuple(len(s) for s in subpaths), np.round(np.concatenate(subpaths) / PATH_PRECISION).astype(np.int32).tobytes())
+        if key not in self.path_index:
+            self.path_index[key] = len(self.paths)
+            self.paths.append(path_data(subpaths))
+        return self.path_index[key]
+
+    def add_image(self, pixel_array):
+        alpha = pixel_array[:, :, 3].astype(np.float64)
+        peak = alpha.max()
+        normalized = pixel_array.copy()
+        if peak > 0:
+            normalized[:, :, 3] = np.round(alpha * 255 / peak).astype(np.uint8)
+        key = hashlib.sha256(normalized.tobytes() + repr(normalized.shape).encode()).hexdigest()
+        if key not in self.image_index:
+            buffer = io.BytesIO()
+            Image.fromarray(normalized, mode="RGBA").save(buffer, format="PNG", optimize=True)
+            self.image_index[key] = len(self.images)
+            self.images.append("data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode())
+        return self.image_index[key], peak / 255
+
+    def vmobject_attrs(self, vmobject):
+        fill, stroke = vmobject.get_fill_rgbas()[0], vmobject.get_stroke_rgbas()[0]
+        width = vmobject.get_stroke_width() * self.camera.cairo_line_width_multiple
+        if fill[3] <= 0 and (stroke[3] <= 0 or width <= 0):
+            return None
+        subpaths = [s[:, :2] * (1, -1) for s in vmobject.get_subpaths() if len(s) >= 4]
+        if not subpaths:
+            return None
+        stacked = np.concatenate(subpaths)
+        low, high = stacked.min(axis=0), stacked.max(axis=0)
+        center, scale = (low + high) / 2, max((high - low).max(), PATH_PRECISION)
+        return {
+            "p": self.add_path([(s - center) / scale for s in subpaths]),
+            "x": _num(center[0]), "y": _num(center[1]), "k": _num(scale, 5),
+            "f": _hex(fill), "fo": _num(fill[3], 3), "s": _hex(stroke), "so": _num(stroke[3], 3), "w": _num(width, 5),
+        }
+
+    def image_attrs(self, image_mobject):
+        ul, ur, dl = (image_mobject.points[:3, :2] * (1, -1))
+        index, opacity = self.add_image(image_mobject.get_pixel_array())
+        if opacity <= 0:
+            return None
+        right, down = ur - ul, dl - ul
+        return {"i": index, "m": [_num(v) for v in (*right, *down, *ul)], "o": _num(opacity, 3)}
+
+    def elements(self, mobject):
+        if hasattr(mobject, "to_vector_elements"):
+            for i, element in enumerate(mobject.to_vector_elements()):
+                (x, y), diameter = element["center"], 2 * element["radius"]
+                yield self.element_id(mobject, i), {
+                    "p": 0, "x": _num(x), "y": _num(-y), "k": _num(diameter, 5),
+                    "f": element["fill"], "fo": _num(element["opacity"], 3), "s": element["fill"], "so": 0, "w": 0,
+                }
+        elif isinstance(mobject, VMobject):
+            attrs = self.vmobject_attrs(mobject)
+            if attrs:
+                yield self.element_id(mobject), attrs
+        elif isinstance(mobject, AbstractImageMobject):
+            attrs = self.image_attrs(mobject)
+            if attrs:
+                yield self.element_id(mobject), attrs
+
+    def capture(self, mobjects, num_frames=1):
+        current = dict(element for mob in mobjects for element in self.elements(mob))
+        frame = {"n": num_frames}
+        changes = {}
+        for eid, attrs in current.items():
+            previous = self.state.get(eid, {})
+            diff = {key: value for key, value in attrs.items() if previous.get(key) != value}
+            if diff:
+                changes[eid] = diff
+                self.state[eid] = attrs
+        order = list(current)
+        if changes:
+            frame["s"] = changes
+        if order != self.order:
+            frame["o"] = order
+            self.order = order
+        background = _hex(color_to_rgba(self.camera.background_color))
+        if background != self.background:
+            frame["b"] = self.background = background
+        if len(frame) == 1 and self.frames:
+            self.frames[-1]["n"] += num_frames
+        else:
+            self.frames.append(frame)
+
+    def to_dict(self):
+        return {
+            "version": 2,
+            "frame_rate": self.camera.frame_rate,
+            "frame_width": self.camera.frame_width,
+            "frame_height": self.camera.frame_height,
+            "center": [_num(v) for v in self.camera.frame_center[:2]],
+            "paths": self.paths,
+            "images": self.images,
+            "frames": self.frames,
+        }
+
+class VectorCaptureRenderer(SeekRenderer):
+    """Steps through every frame like a real render, but hands the displayed
+    mobjects to a :class:`VectorRecorder` instead of rasterizing them."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.skip_animations = self._original_skipping_status = False
+        self.recorder = VectorRecorder(self.camera)
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.scene = scene
+
+    def get_frame(self):
+        return None
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        displayed = list_update(self.scene.mobjects, self.scene.foreground_mobjects)
+        self.recorder.capture(self.camera.get_mobjects_to_display(displayed), num_frames)
+
+def export_scene(scene_cls, out_dir=VECTOR_DIR):
+    """Write ``<Scene>.json`` and a self-contained ``<Scene>.html`` player for
+    ``scene_cls`` and return both paths."""
+    with tempconfig({"write_to_movie": False, "save_last_frame": False, "disable_caching": True}):
+        renderer = VectorCaptureRenderer()
+        scene = type(scene_cls.__name__, (scene_cls,), {"save_snapshots": False})(renderer=renderer)
+        scene.render()
+    data = json.dumps(renderer.recorder.to_dict(), separators=(",", ":"))
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, f"{scene_cls.__name__}.json")
+    html_path = os.path.join(out_dir, f"{scene_cls.__name__}.html")
+    with open(json_path, "w") as f:
+        f.write(data)
+    with open(html_path, "w") as f:
+        f.write(PLAYER_HTML.format(title=scene_cls.__name__, player=PLAYER_JS, data=data))
+    return json_path, html_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a scene as a keyframed vector animation with an HTML player.")
+    parser.add_argument("file", nargs="?", default="video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("-o", "--out-dir", default=VECTOR_DIR)
+    parser.add_argument("--fps", type=float, default=None)
+    args = parser.parse_args()
+    with tempconfig({"frame_rate": args.fps} if args.fps else {}):
+        module = load_scene_module(args.file)
+        for path in export_scene(getattr(module, args.scene), args.out_dir):
+            print(f"{path}  {os.path.getsize(path) / 1024:.0f} KiB")
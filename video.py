@@ -1,7 +1,27 @@
 from manim import *
+from manim.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+import gc
 import random
 import numpy as np
 from scipy.interpolate import CubicSpline
+from glyph_cache import cached_text, clear_glyph_tiles
+from classical_factoring import load_or_run_benchmark
+from measurement_sampling import register_distribution, sample_period_finding
+from order_tables import load_or_build_tables
+from histogram import AnimateHistogram
+from statevector import RegisterView, ShorStatevector, StageTransition
+from batched_transform import BatchedRotate
+from particles import EmitParticles, radial_burst
+from localization import tr
+from atlas_math import math_tex
+from templated_tex import ChangeFields, TemplatedMathTex
+from curve_lod import AdaptiveParametricFunction, adaptive_plot
+from scene_snapshots import restore_nearest_snapshot, save_snapshot, section_snapshot_paths
+import svg_geometry_cache
+import arc_length
+
+svg_geometry_cache.install()
+arc_length.install()
 
 DARK_BACKGROUND_COLOR = "#090d1a"
 TEXT_COLOR = WHITE
@@ -10,20 +30,63 @@ SECONDARY_ACCENT_COLOR = "#38a3a5"
 GRAPH_COLOR = "#00FF00"
 ERROR_COLOR = "#FF3333"
 ICON_COLOR = WHITE
+SHOR_SAMPLE_SEED = 2048
+ORDER_TABLE_BOUND = 64
+
+def shor_example():
+    """Order tables plus the smallest odd composite where most bases work and
+    its smallest good base, i.e. N = 15 and a = 2."""
+    tables = load_or_build_tables(bound=ORDER_TABLE_BOUND, detail_bound=ORDER_TABLE_BOUND)
+    N = int(tables.moduli(min_good_fraction=0.5)[0])
+    return tables, N, int(tables.good_bases(N)[0])
 
 def create_title(text_str):
-    return Text(text_str, font_size=40, color=PRIMARY_ACCENT_COLOR).to_edge(UP, buff=0.5)
+    return Text(tr(text_str), font_size=40, color=PRIMARY_ACCENT_COLOR).to_edge(UP, buff=0.5)
+
+def create_benchmark_plot(bench, method="quadratic_sieve", max_bits=512):
+    bits, seconds = bench.median_timings(method)
+    fit_log_seconds = lambda b: float(np.log10(bench.extrapolate(method, b)))
+    y_min = np.floor(min(np.log10(seconds).min(), fit_log_seconds(bits.min())))
+    y_max = np.ceil(fit_log_seconds(max_bits))
+    axes = Axes(
+        x_range=[0, max_bits, 128], y_range=[y_min, y_max, max(1, (y_max - y_min) // 4)], x_length=4.0, y_length=2.4,
+        axis_config={"include_numbers": True, "font_size": 16, "color": TEXT_COLOR}, tips=False,
+    )
+    x_label = axes.get_x_axis_label(Text(tr("bits"), font_size=16), edge=DOWN, direction=DOWN, buff=0.3)
+    y_label = Text(tr("log₁₀ seconds"), font_size=16).rotate(PI/2).next_to(axes.y_axis, LEFT, buff=0.35)
+    measured = VGroup(*[Dot(axes.c2p(b, np.log10(s)), radius=0.04, color=GRAPH_COLOR) for b, s in zip(bits, seconds)])
+    fit_curve = DashedVMobject(axes.plot(fit_log_seconds, x_range=[bits.min(), max_bits], color=ERROR_COLOR, stroke_width=3), num_dashes=30)
+    years = bench.years_to_factor(2048, method)
+    estimate = math_tex(f"\\text{{{tr('2048-bit RSA')}}} \\approx 10^{{{int(np.log10(years))}}}\\text{{ {tr('years')}}}", font_size=24, color=ERROR_COLOR).next_to(axes, DOWN, buff=0.45)
+    return VGroup(axes, x_label, y_label, measured, fit_curve, estimate)
 
 class QuantumBaseScene(Scene):
+    resume_before = None
+    save_snapshots = True
+
     def setup_scene_defaults(self):
         self.camera.background_color = DARK_BACKGROUND_COLOR
 
+    def teardown_section(self):
+        for mob in self.get_mobject_family_members():
+            mob.clear_updaters()
+        self.clear()
+        self.updaters.clear()
+        self.animations = None
+        self.moving_mobjects = []
+        self.static_mobjects = []
+        self.renderer.static_image = None
+        self.camera.background_color = DARK_BACKGROUND_COLOR
+        clear_glyph_tiles()
+        SVG_HASH_TO_MOB_MAP.clear()
+        gc.collect()
+
 class IntroScenes(QuantumBaseScene):
     def construct(self):
         self.setup_scene_defaults()
 
         current_scene_duration_target_s0 = 7.0; anim_time_s0 = 0
-        hook_elements = VGroup()
+        hook_elements = Group()
         icon_scale = 0.55
         email_icon = Text("✉", font_size=96, color=ICON_COLOR).scale(icon_scale)
         dollar_icon = Text("$", font_size=96, color=ICON_COLOR, weight=BOLD).scale(icon_scale)
@@ -36,14 +99,14 @@ class IntroScenes(QuantumBaseScene):
         self.wait(0.3); anim_time_s0 += 0.3
         self.play(FadeIn(shield_icon, run_time=0.5)); anim_time_s0 += 0.5
         self.wait(0.2); anim_time_s0 += 0.2
-        number_2048 = Text("2048", font_size=280, color=TEXT_COLOR, weight=BOLD).set_opacity(0.0).move_to(ORIGIN).set_z_index(icons.z_index - 1)
+        number_2048 = cached_text("2048", max_scale=1.3, font_size=280, color=TEXT_COLOR, weight=BOLD).set_opacity(0.0).move_to(ORIGIN).set_z_index(icons.z_index - 1)
         hook_elements.add(number_2048)
-        lock_icon_s0 = Text("🔒", font_size=110, color=ERROR_COLOR).move_to(ORIGIN).set_z_index(number_2048.z_index + 1)
+        lock_icon_s0 = cached_text("🔒", max_scale=1.2, font_size=110, color=ERROR_COLOR).move_to(ORIGIN).set_z_index(number_2048.z_index + 1)
         hook_elements.add(lock_icon_s0)
         self.play(number_2048.animate.set_opacity(0.25).scale(1.3, about_point=ORIGIN), run_time=1.5); anim_time_s0 += 1.5
         self.play(FadeIn(lock_icon_s0, scale=0.5, run_time=0.3)); anim_time_s0 += 0.3
         self.play(Indicate(lock_icon_s0, scale_factor=1.2, color=RED_B, repetitions=2, run_time=0.6)); anim_time_s0 += 0.6
-        hook_text_str = "Or could quantum waves\nbreak every secret?"
+        hook_text_str = tr("Or could quantum waves\nbreak every secret?")
         hook_text_obj = Text(hook_text_str, font_size=48, color=TEXT_COLOR, weight=BOLD, line_spacing=0.9).move_to(ORIGIN)
         hook_elements.add(hook_text_obj)
         self.play(FadeIn(hook_text_obj, shift=DOWN*0.1, run_time=1.0), FadeOut(icons, lock_icon_s0, number_2048, run_time=0.8)); anim_time_s0 += 1.0
@@ -77,20 +140,21 @@ class IntroScenes(QuantumBaseScene):
         self.wait(0.1)
 
         current_scene_duration_target_s2 = 13.0; anim_time_s2 = 0
-        scene2_elements = VGroup()
+        scene2_elements = Group()
         original_bg_color_scene2 = self.camera.background_color
+        classical_benchmark = load_or_run_benchmark()
         self.camera.background_color = ManimColor("#1A1A1A")
 
-        n15_latex = MathTex("N = 15", font_size=72, color=TEXT_COLOR).to_edge(UP, buff=1.0)
-        infinity_sym = Text("∞", font_size=100, color=ERROR_COLOR).next_to(n15_latex, DOWN, buff=0.8)
-        caption_classical = Text("Classical computers: Too slow for big numbers!", font_size=28, color=TEXT_COLOR).to_edge(DOWN, buff=1.2)
+        n15_latex = math_tex("N = 15", font_size=72, color=TEXT_COLOR).to_edge(UP, buff=1.0)
+        infinity_sym = cached_text("∞", max_scale=1.9, font_size=100, color=ERROR_COLOR).next_to(n15_latex, DOWN, buff=0.8)
+        caption_classical = Text(tr("Classical computers: Too slow for big numbers!"), font_size=28, color=TEXT_COLOR).to_edge(DOWN, buff=1.2)
         scene2_elements.add(n15_latex, caption_classical, infinity_sym)
         self.play(Write(n15_latex, run_time=1.0)); anim_time_s2 += 1.0
         self.play(FadeIn(infinity_sym, run_time=0.5)); anim_time_s2 += 0.5
         self.play(infinity_sym.animate(run_time=0.5, rate_func=rate_functions.wiggle).scale(1.1)); anim_time_s2 += 0.5
 
         def create_flash_panel(text_str, color, position):
-            text_mobj = Text(text_str, font_size=36, color=color)
+            text_mobj = Text(tr(text_str), font_size=36, color=color)
             panel_fill_color = ManimColor("#1A1A1A").interpolate(BLACK, 0.5)
             panel = Rectangle(
                 width=text_mobj.width + 0.4, height=text_mobj.height + 0.4,
@@ -116,7 +180,14 @@ class IntroScenes(QuantumBaseScene):
 
         self.play(FadeIn(caption_classical, run_time=0.8)); anim_time_s2 += 0.8
         infinity_growth_duration = 2.0
-        self.play(infinity_sym.animate.scale(1.7).set_opacity(0.75).move_to(ORIGIN), run_time=infinity_growth_duration)
+        benchmark_plot = create_benchmark_plot(classical_benchmark).scale(0.8).move_to(RIGHT*4.0 + DOWN*0.3)
+        scene2_elements.add(benchmark_plot)
+        self.play(
+            infinity_sym.animate.scale(1.7).set_opacity(0.75).move_to(ORIGIN),
+            Create(benchmark_plot[:3]), LaggedStart(*[GrowFromCenter(d) for d in benchmark_plot[3]], lag_ratio=0.1),
+            Create(benchmark_plot[4], rate_func=rate_functions.ease_in_quad), FadeIn(benchmark_plot[5], shift=UP*0.1),
+            run_time=infinity_growth_duration
+        )
         anim_time_s2 += infinity_growth_duration
         self.wait(max(0.01, current_scene_duration_target_s2 - anim_time_s2 - 0.5))
         self.play(FadeOut(scene2_elements, run_time=0.5))
@@ -133,12 +204,11 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
         scene1_elements.add(title_s1)
         self.play(Write(title_s1, run_time=0.8)); anim_time_s1 += 0.8
 
-        N_val = 15
-        a_val = 2
+        order_tables, N_val, a_val = shor_example()
 
         n_a_text_group = VGroup(
-            MathTex(f"N = {N_val}", font_size=32),
-            MathTex(f"\\text{{Our guess: }} a = {a_val}", font_size=32)
+            math_tex(f"N = {N_val}", font_size=32),
+            math_tex(f"\\text{{Our guess: }} a = {a_val}", font_size=32)
         ).arrange(RIGHT, buff=1.0).next_to(title_s1, DOWN, buff=0.45)
         scene1_elements.add(n_a_text_group)
 
@@ -147,7 +217,10 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
         self.play(Write(n_a_text_group[1]), run_time=0.7); anim_time_s1 += 0.7
         self.wait(0.8); anim_time_s1 += 0.8
 
-        calc_display_s1 = MathTex("", font_size=28, color=YELLOW_A).to_edge(DOWN, buff=0.3)
+        calc_display_s1 = TemplatedMathTex(
+            "\\text{{Step }} {x}: {a}^{{{x}}} \\pmod{{{N}}} = {value}", font_size=28, color=YELLOW_A,
+            a=a_val, N=N_val, x=0, value=1
+        ).to_edge(DOWN, buff=0.3)
         scene1_elements.add(calc_display_s1)
 
         wheel_radius = 2.0
@@ -176,28 +249,26 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
 
         max_x = 7
         r_val = 0
+        period = order_tables.order(N_val, a_val)
         anim_calc_write = 0.4
         anim_pulse_move = 0.65
         anim_spot_write = 0.55
 
         for x_val in range(max_x + 1):
-            new_calc_str = f"\\text{{Step }} {x_val}: {a_val}^{{{x_val}}} \\pmod{{{N_val}}} = {current_val}"
-            new_calc_display = MathTex(new_calc_str, font_size=28, color=YELLOW_A).move_to(calc_display_s1.get_center())
-
             angle = TAU * current_val / N_val - PI/2
             target_pos_on_wheel = wheel_center + wheel_radius * np.array([np.cos(angle), np.sin(angle), 0])
 
             if x_val == 0:
                 pulse_group.move_to(target_pos_on_wheel)
-                self.play(Transform(calc_display_s1, new_calc_display), GrowFromCenter(pulse_group), run_time=max(anim_calc_write, anim_pulse_move))
+                self.play(FadeIn(calc_display_s1), GrowFromCenter(pulse_group), run_time=max(anim_calc_write, anim_pulse_move))
             else:
-                self.play(Transform(calc_display_s1, new_calc_display), pulse_group.animate.move_to(target_pos_on_wheel), run_time=max(anim_calc_write, anim_pulse_move), rate_func=rate_functions.ease_in_out_sine)
+                self.play(ChangeFields(calc_display_s1, {"x": x_val, "value": current_val}, counting=False), pulse_group.animate.move_to(target_pos_on_wheel), run_time=max(anim_calc_write, anim_pulse_move), rate_func=rate_functions.ease_in_out_sine)
             anim_time_s1 += max(anim_calc_write, anim_pulse_move)
 
             landing_spot_highlight = Dot(point=target_pos_on_wheel, radius=0.2, color=GRAPH_COLOR, fill_opacity=0.4).set_z_index(landing_spots_highlights.z_index)
             landing_spots_highlights.add(landing_spot_highlight)
 
-            val_text = MathTex(str(current_val), font_size=26, color=GRAPH_COLOR)
+            val_text = math_tex(str(current_val), font_size=26, color=GRAPH_COLOR)
             live_sequence_display.add(val_text)
 
             self.play(
@@ -207,7 +278,7 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
             )
             anim_time_s1 += anim_spot_write
 
-            if x_val == 3: r_val = 4
+            if x_val == period - 1: r_val = period
             if x_val < max_x: current_val = (a_val**(x_val+1)) % N_val
 
         self.play(FadeOut(calc_display_s1), run_time=0.2); anim_time_s1 += 0.2
@@ -221,7 +292,7 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
                 stroke_width=3,
                 buff=0.15
             )
-            length_text = MathTex(
+            length_text = math_tex(
                 f"\\text{{Pattern length: }} r = {r_val}",
                 font_size=26,
                 color=PRIMARY_ACCENT_COLOR
@@ -245,12 +316,12 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
         scene2_elements.add(title_s2)
         self.play(Write(title_s2, run_time=0.7)); anim_time_s2 += 0.7
 
-        classical_label = Text("Classical Bit:", font_size=28, color=TEXT_COLOR).move_to(LEFT*4.0 + UP*1.8)
+        classical_label = Text(tr("Classical Bit:"), font_size=28, color=TEXT_COLOR).move_to(LEFT*4.0 + UP*1.8)
         bit_0_visual = Circle(radius=0.4, color=BLUE_D, fill_opacity=0.7).next_to(classical_label, DOWN, buff=0.35)
         text_0_cb = Text("0", font_size=32, color=TEXT_COLOR).move_to(bit_0_visual)
         bit_1_visual = Circle(radius=0.4, color=GREEN_D, fill_opacity=0.7).move_to(bit_0_visual)
         text_1_cb = Text("1", font_size=32, color=TEXT_COLOR).move_to(bit_1_visual)
-        classical_desc = Text("One state at a time", font_size=22, color=TEXT_COLOR).next_to(bit_0_visual, DOWN, buff=0.5)
+        classical_desc = Text(tr("One state at a time"), font_size=22, color=TEXT_COLOR).next_to(bit_0_visual, DOWN, buff=0.5)
         classical_group = VGroup(classical_label, bit_0_visual, text_0_cb, classical_desc)
         scene2_elements.add(classical_group)
         self.play(FadeIn(classical_group, shift=RIGHT*0.2), run_time=0.7); anim_time_s2 += 0.7
@@ -267,23 +338,23 @@ class PeriodFindingAndSuperposition(QuantumBaseScene):
             rate_func=rate_functions.there_and_back_with_pause, run_time=1.5
         ); anim_time_s2 += 1.5; self.remove(outer_pulse_0, outer_pulse_1)
 
-        qubit_label = Text("Quantum Bit (Qubit):", font_size=28, color=TEXT_COLOR).move_to(RIGHT*4.0 + UP*1.8)
+        qubit_label = Text(tr("Quantum Bit (Qubit):"), font_size=28, color=TEXT_COLOR).move_to(RIGHT*4.0 + UP*1.8)
         sphere_center = qubit_label.get_center() + DOWN*2.0; radius = 1.1
         ghost_sphere = Sphere(radius=radius, resolution=(20,20), fill_opacity=0.15, stroke_opacity=0.25, color=GRAY)
         ghost_sphere.move_to(sphere_center)
         pole_0 = sphere_center + UP * radius; pole_1 = sphere_center + DOWN * radius
-        label_0_s2 = MathTex("|0\\rangle", font_size=34).next_to(pole_0, UP, buff=0.1)
-        label_1_s2 = MathTex("|1\\rangle", font_size=34).next_to(pole_1, DOWN, buff=0.1)
+        label_0_s2 = math_tex("|0\\rangle", font_size=34).next_to(pole_0, UP, buff=0.1)
+        label_1_s2 = math_tex("|1\\rangle", font_size=34).next_to(pole_1, DOWN, buff=0.1)
         z_axis = DashedLine(pole_0, pole_1, dash_length=0.1, color=GRAY, stroke_width=2.5)
         qubit_arrow = Arrow(start=sphere_center, end=sphere_center + UP*radius*0.8, color=PRIMARY_ACCENT_COLOR, buff=0, stroke_width=6, max_tip_length_to_length_ratio=0.18)
-        qubit_desc = Text("Multiple states at a time!", font_size=22, color=TEXT_COLOR).next_to(ghost_sphere, DOWN, buff=0.7)
+        qubit_desc = Text(tr("Multiple states at a time!"), font_size=22, color=TEXT_COLOR).next_to(ghost_sphere, DOWN, buff=0.7)
 
         qubit_viz_group = VGroup(qubit_label, ghost_sphere, z_axis, label_0_s2, label_1_s2, qubit_arrow, qubit_desc)
         scene2_elements.add(qubit_viz_group)
         self.play(FadeIn(qubit_viz_group, shift=LEFT*0.2), run_time=0.8); anim_time_s2 += 0.8
 
         path_func_s2 = lambda t: sphere_center + radius * np.array([ np.sin(TAU*t*1.2+PI/3)*np.cos(TAU*t*0.9+PI/4), np.sin(TAU*t*1.2+PI/3)*np.sin(TAU*t*0.9+PI/4), np.cos(TAU*t*1.2+PI/3) ])
-        path_s2 = ParametricFunction(path_func_s2, t_range=[0,1.5], stroke_width=0)
+        path_s2 = AdaptiveParametricFunction(path_func_s2, t_range=[0,1.5], stroke_width=0)
         arrow_tip_tracker = Dot(point=path_s2.get_start(), radius=0.001).set_opacity(0)
         qubit_arrow.add_updater(lambda mob: mob.put_start_and_end_on(sphere_center, arrow_tip_tracker.get_center()))
         trail = TracedPath(arrow_tip_tracker.get_center, stroke_color=PRIMARY_ACCENT_COLOR, stroke_width=3, stroke_opacity=[0,0.6,0], dissipating_time=0.4)
@@ -303,9 +374,12 @@ class QFTPeriodFindingScene(QuantumBaseScene):
     def construct(self):
         self.setup_scene_defaults()
 
-        N = 15
-        a = 2
-        r = 4
+        _, N, a = shor_example()
+        n_count = 10
+        register_probs = register_distribution(N, a, n_count)
+        shor_samples = sample_period_finding(N, a, n_count=n_count, shots=4096, probs=register_probs, seed=SHOR_SAMPLE_SEED)
+        r = shor_samples.period
+        half_power = a**(r // 2)
         LABEL_FONT_SIZE = 24
 
         title = create_title("QFT: How Quantum Finds Patterns")
@@ -317,13 +391,13 @@ class QFTPeriodFindingScene(QuantumBaseScene):
             tips=False,
         ).next_to(title, DOWN, buff=0.5)
 
-        x_label = input_axes.get_x_axis_label(Text("x (inputs)", font_size=LABEL_FONT_SIZE), edge=DOWN, buff=1.2)
-        y_label = MathTex("2^x \\pmod{15}", font_size=LABEL_FONT_SIZE).rotate(PI/2).next_to(input_axes.y_axis, LEFT, buff=0.4)
+        x_label = input_axes.get_x_axis_label(Text(tr("x (inputs)"), font_size=LABEL_FONT_SIZE), edge=DOWN, buff=1.2)
+        y_label = math_tex("2^x \\pmod{15}", font_size=LABEL_FONT_SIZE).rotate(PI/2).next_to(input_axes.y_axis, LEFT, buff=0.4)
         input_axes.add(x_label, y_label)
 
         x_coords = np.arange(0, 17); y_coords = (a**x_coords) % N
         spline = CubicSpline(x_coords, y_coords, bc_type='periodic')
-        graph_line = input_axes.plot(spline, x_range=[0, 16], color=GRAPH_COLOR, stroke_width=4)
+        graph_line = adaptive_plot(input_axes, spline, x_range=[0, 16], color=GRAPH_COLOR, stroke_width=4)
         graph_dots = VGroup(*[Dot(input_axes.c2p(x, y), color=PRIMARY_ACCENT_COLOR, radius=0.07) for x, y in zip(x_coords[:-1], y_coords[:-1])])
 
         self.play(Create(input_axes), Create(graph_line), FadeIn(graph_dots, lag_ratio=0.05), run_time=2.0)
@@ -343,8 +417,9 @@ class QFTPeriodFindingScene(QuantumBaseScene):
         center_proc = qft_processor.get_center()
         qft_waves = VGroup()
         for _ in range(15):
-            wave = ParametricFunction(
-                lambda t: np.array([t, 0.2*np.sin(random.uniform(3,6)*t + random.uniform(0,TAU)), 0]),
+            frequency, phase = random.uniform(3, 6), random.uniform(0, TAU)
+            wave = AdaptiveParametricFunction(
+                lambda t, frequency=frequency, phase=phase: np.array([t, 0.2*np.sin(frequency*t + phase), 0]),
                 t_range=[-1.0, 1.0], stroke_width=random.uniform(1.5, 2.5),
                 color=interpolate_color(ManimColor(SECONDARY_ACCENT_COLOR), ManimColor(PRIMARY_ACCENT_COLOR), random.random())
             ).scale(random.uniform(0.5, 0.8)).move_to(center_proc).rotate(random.uniform(0, TAU))
@@ -356,10 +431,10 @@ class QFTPeriodFindingScene(QuantumBaseScene):
             rt = 0.5 - i * 0.1
             scale_factor = 1.1 + i * 0.2
             wiggle_intensity = 1.05 + i * 0.05
-            rotation_anims = [Rotate(wave, angle=TAU * 0.5 * random.choice([-1, 1]), rate_func=linear) for wave in qft_waves]
+            wave_angles = [TAU * 0.5 * random.choice([-1, 1]) for _ in qft_waves]
 
             self.play(
-                AnimationGroup(*rotation_anims),
+                BatchedRotate(qft_waves, wave_angles, rate_func=linear),
                 qft_processor.animate.scale(scale_factor),
                 Wiggle(qft_processor, scale_value=wiggle_intensity, rotation_angle=0.03 * (i+1) * TAU),
                 run_time=rt
@@ -367,38 +442,67 @@ class QFTPeriodFindingScene(QuantumBaseScene):
 
         self.play(FadeOut(qft_processor, scale=5), FadeOut(qft_waves), Flash(center_proc, color=PRIMARY_ACCENT_COLOR, line_length=1.0, num_lines=20, flash_radius=3.5), run_time=0.5)
 
-        period_result = MathTex("r = 4", font_size=72, color=PRIMARY_ACCENT_COLOR)
+        register_size = 2**n_count
+        register_stages = ShorStatevector(N, a, n_count).stages()
+        next(register_stages)
+        register_hist = RegisterView(
+            next(register_stages)[1], work_value=1, width=9, height=3.2,
+            color=[SECONDARY_ACCENT_COLOR, PRIMARY_ACCENT_COLOR],
+        ).move_to(DOWN*0.3)
+        register_axis = Line(register_hist.get_corner(DL), register_hist.get_corner(DR), color=TEXT_COLOR, stroke_width=2)
+        outcome_label = Text(tr("{count} register outcomes y").format(count=register_size), font_size=LABEL_FONT_SIZE).next_to(register_axis, DOWN, buff=0.3)
+        success_label = Text(
+            tr("{shots} shots: {rate:.0%} reveal a factor").format(shots=shor_samples.shots, rate=shor_samples.success_rate), font_size=LABEL_FONT_SIZE, color=GRAPH_COLOR
+        ).next_to(register_hist, UP, buff=0.4)
+        stage_captions = [
+            tr("Hadamards: all {count} values at once").format(count=register_size),
+            tr("Modular exponentiation: a rhythm every {r} steps").format(r=r),
+            tr("QFT: the rhythm becomes {r} peaks").format(r=r),
+        ]
+        stage_label = Text(stage_captions[0], font_size=LABEL_FONT_SIZE, color=TEXT_COLOR).next_to(register_hist, UP, buff=0.4)
+        self.play(Create(register_axis), FadeIn(register_hist), FadeIn(outcome_label), FadeIn(stage_label), run_time=0.6)
+        for caption, (_, amplitudes) in zip(stage_captions[1:], register_stages):
+            next_label = Text(caption, font_size=LABEL_FONT_SIZE, color=TEXT_COLOR).move_to(stage_label)
+            self.play(StageTransition(register_hist, amplitudes), FadeTransform(stage_label, next_label), run_time=1.2)
+            stage_label = next_label
+        sampled_heights = np.bincount(shor_samples.outcomes, minlength=register_size) / shor_samples.shots
+        register_hist.max_value = max(register_hist.max_value, sampled_heights.max())
+        self.play(AnimateHistogram(register_hist, sampled_heights), FadeOut(stage_label), Write(success_label), run_time=0.8)
+        self.wait(1.0)
+        self.play(FadeOut(register_hist, register_axis, outcome_label, success_label), run_time=0.5)
+
+        period_result = math_tex(f"r = {r}", font_size=72, color=PRIMARY_ACCENT_COLOR)
         self.play(Write(period_result), run_time=1.0)
 
         self.play(period_result.animate.to_edge(UP, buff=1.0), run_time=1.0)
 
         known_values = VGroup(
-            MathTex("a = 2", font_size=48),
-            MathTex("N = 15", font_size=48)
+            math_tex(f"a = {a}", font_size=48),
+            math_tex(f"N = {N}", font_size=48)
         ).arrange(RIGHT, buff=1.0).next_to(period_result, DOWN, buff=0.75)
         self.play(FadeIn(known_values, lag_ratio=0.5), run_time=1.0)
 
         calc_group = VGroup(
-            MathTex("gcd(a^{r/2} - 1, N)"),
-            MathTex("gcd(a^{r/2} + 1, N)")
+            math_tex("gcd(a^{r/2} - 1, N)"),
+            math_tex("gcd(a^{r/2} + 1, N)")
         ).arrange(RIGHT, buff=2.0).next_to(known_values, DOWN, buff=1.0).scale(0.9)
         self.play(Write(calc_group), run_time=1.0)
 
         sub_group = VGroup(
-            MathTex("gcd(2^{4/2} - 1, 15)"),
-            MathTex("gcd(2^{4/2} + 1, 15)")
+            math_tex(f"gcd({a}^{{{r}/2}} - 1, {N})"),
+            math_tex(f"gcd({a}^{{{r}/2}} + 1, {N})")
         ).arrange(RIGHT, buff=2.0).move_to(calc_group)
         self.play(Transform(calc_group, sub_group), run_time=1.0)
 
         eval_group = VGroup(
-            MathTex("gcd(3, 15)"),
-            MathTex("gcd(5, 15)")
+            math_tex(f"gcd({half_power - 1}, {N})"),
+            math_tex(f"gcd({half_power + 1}, {N})")
         ).arrange(RIGHT, buff=3.0).move_to(calc_group)
         self.play(Transform(calc_group, eval_group), run_time=1.0)
 
         final_factors = VGroup(
-            MathTex("3", font_size=72, color=GRAPH_COLOR),
-            MathTex("5", font_size=72, color=GRAPH_COLOR)
+            math_tex(str(np.gcd(half_power - 1, N)), font_size=72, color=GRAPH_COLOR),
+            math_tex(str(np.gcd(half_power + 1, N)), font_size=72, color=GRAPH_COLOR)
         ).arrange(RIGHT, buff=4.0).move_to(calc_group)
 
         boxes = VGroup(
@@ -408,7 +512,7 @@ class QFTPeriodFindingScene(QuantumBaseScene):
 
         self.play(Transform(calc_group, final_factors), Create(boxes), run_time=1.5)
 
-        conclusion = Text("Prime factors found!", font_size=36, color=PRIMARY_ACCENT_COLOR).next_to(boxes, DOWN, buff=1.0)
+        conclusion = Text(tr("Prime factors found!"), font_size=36, color=PRIMARY_ACCENT_COLOR).next_to(boxes, DOWN, buff=1.0)
         self.play(Write(conclusion), run_time=1.0)
 
         self.wait(1.0)
@@ -421,9 +525,9 @@ class OutroScene(QuantumBaseScene):
         current_scene_duration_cta = 5.0; anim_time_cta = 0
         cta_elements = VGroup()
 
-        cta1 = Text("Shor's algorithm uses embedded patterns,", font_size=36, color=TEXT_COLOR, t2w={'hidden patterns': BOLD}).move_to(UP*0.8)
-        cta2 = Text("hidden deep within waves.", font_size=36, color=TEXT_COLOR, t2w={'great challenges': BOLD}).next_to(cta1, DOWN, buff=0.3)
-        cta3 = Text("All unlocked by Quantum.", font_size=48, color=PRIMARY_ACCENT_COLOR, weight=BOLD).next_to(cta2, DOWN, buff=0.8)
+        cta1 = Text(tr("Shor's algorithm uses embedded patterns,"), font_size=36, color=TEXT_COLOR, t2w={'hidden patterns': BOLD}).move_to(UP*0.8)
+        cta2 = Text(tr("hidden deep within waves."), font_size=36, color=TEXT_COLOR, t2w={'great challenges': BOLD}).next_to(cta1, DOWN, buff=0.3)
+        cta3 = Text(tr("All unlocked by Quantum."), font_size=48, color=PRIMARY_ACCENT_COLOR, weight=BOLD).next_to(cta2, DOWN, buff=0.8)
         cta_elements.add(cta1, cta2, cta3)
 
         self.play(Write(cta1, rate_func=slow_into), run_time=1.0); anim_time_cta += 1.0
@@ -431,20 +535,14 @@ class OutroScene(QuantumBaseScene):
         self.play(GrowFromCenter(cta3, rate_func=rate_functions.ease_out_elastic), run_time=1.2); anim_time_cta += 1.2
 
         sparkle_duration = 1.3
-        sparkle_anims_cta = []
-        for _ in range(35):
-            sparkle = Dot(radius=random.uniform(0.005, 0.035)).set_color(random_bright_color())
-            sparkle.set_opacity(random.uniform(0.6, 1.0))
-            start_pos = cta3.get_center()
-            end_pos = start_pos + rotate_vector(RIGHT * random.uniform(1.8, config.frame_width/2.0), random.uniform(0, TAU))
-            sparkle.move_to(start_pos)
-            sparkle_anims_cta.append(
-                sparkle.animate(
-                    path_arc=random.uniform(-PI/2.5, PI/2.5),
-                    rate_func=rate_functions.rush_from if random.random() > 0.5 else rate_functions.rush_into
-                ).move_to(end_pos).set_opacity(0).scale(random.uniform(0.5,1.2))
-            )
-        self.play(LaggedStart(*sparkle_anims_cta, lag_ratio=0.015, run_time=sparkle_duration)); anim_time_cta += sparkle_duration
+        sparkles = radial_burst(
+            cta3.get_center(), 35, distance_range=(1.8, config.frame_width/2.0), radius_range=(0.005, 0.035),
+            colors=[random_bright_color() for _ in range(35)], opacity_range=(0.6, 1.0), scale_range=(0.5, 1.2),
+            arc_range=(-PI/2.5, PI/2.5), rate_funcs=(rate_functions.rush_from, rate_functions.rush_into),
+            lag_ratio=0.015, seed=random.getrandbits(32)
+        )
+        self.play(EmitParticles(sparkles, run_time=sparkle_duration)); anim_time_cta += sparkle_duration
+        self.remove(sparkles)
 
         self.wait(max(0.01, current_scene_duration_cta - anim_time_cta - 0.5))
         self.play(FadeOut(cta_elements, run_time=0.5))
@@ -452,8 +550,8 @@ class OutroScene(QuantumBaseScene):
 
         current_scene_duration_credits = 5.0; anim_time_credits = 0
         credits_elements = VGroup()
-        code_by_text = Text("Code by Dhaval Pandey, Tiffin School", font_size=36, color=TEXT_COLOR).center().shift(UP*0.3)
-        contest_text = Text("Read description for more", font_size=28, color=PRIMARY_ACCENT_COLOR).next_to(code_by_text, DOWN, buff=0.5)
+        code_by_text = Text(tr("Code by Dhaval Pandey, Tiffin School"), font_size=36, color=TEXT_COLOR).center().shift(UP*0.3)
+        contest_text = Text(tr("Read description for more"), font_size=28, color=PRIMARY_ACCENT_COLOR).next_to(code_by_text, DOWN, buff=0.5)
         credits_elements.add(code_by_text, contest_text)
 
         self.play(FadeIn(credits_elements, run_time=1.0)); anim_time_credits += 1.0
@@ -462,9 +560,18 @@ class OutroScene(QuantumBaseScene):
         self.wait(0.1)
 
 class FullVideo(QuantumBaseScene):
+    sections = (IntroScenes, PeriodFindingAndSuperposition, QFTPeriodFindingScene, OutroScene)
+
     def construct(self):
-        self.setup_scene_defaults()
-        IntroScenes.construct(self)
-        PeriodFindingAndSuperposition.construct(self)
-        QFTPeriodFindingScene.construct(self)
-        OutroScene.construct(self)
\ No newline at end of file
+        snapshot_paths = section_snapshot_paths(self.sections)
+        first_section = 0
+        if self.resume_before is not None:
+            first_section = restore_nearest_snapshot(self, snapshot_paths, self.resume_before)
+        for index in range(first_section, len(self.sections)):
+            section = self.sections[index]
+            self.next_section(section.__name__)
+            self.setup_scene_defaults()
+            section.construct(self)
+            if self.save_snapshots:
+                save_snapshot(self, snapshot_paths[index])
+            self.teardown_section()
\ No newline at end of file
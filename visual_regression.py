@@ -0,0 +1,94 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from scipy.fft import dctn
+from scipy.ndimage import gaussian_filter
+
+from manim import tempconfig
+from frame_render import render_frames
+from render_cache import load_scene_module
+
+REFERENCE_DIR = Path("media", "reference_frames")
+RESOLUTION = (320, 180)
+KEY_FRAMES = {
+    "IntroScenes": (2.5, 5.0, 9.5, 14.0, 23.0, 30.0),
+    "PeriodFindingAndSuperposition": (3.0, 9.0, 15.0, 21.0, 24.5),
+    "QFTPeriodFindingScene": (3.5, 8.0, 11.5, 14.0, 18.0, 22.5),
+    "OutroScene": (2.5, 4.0, 7.0),
+}
+MAX_HASH_DISTANCE = 6
+MIN_SSIM = 0.97
+
+def luminance(frame):
+    rgb = np.asarray(frame, dtype=np.float64)[..., :3] / 255.0
+    return rgb @ np.array([0.299, 0.587, 0.114])
+
+def perceptual_hash(frame, hash_size=8, sample_size=32):
+    small = Image.fromarray(np.uint8(luminance(frame) * 255)).resize((sample_size, sample_size), Image.LANCZOS)
+    low_freq = dctn(np.asarray(small, dtype=np.float64), norm="ortho")[:hash_size, :hash_size]
+    return (low_freq > np.median(low_freq)).ravel()
+
+def ssim(frame_a, frame_b, sigma=1.5):
+    a, b = luminance(frame_a), luminance(frame_b)
+    c1, c2 = 0.01**2, 0.03**2
+    mu_a, mu_b = gaussian_filter(a, sigma), gaussian_filter(b, sigma)
+    var_a = gaussian_filter(a * a, sigma) - mu_a**2
+    var_b = gaussian_filter(b * b, sigma) - mu_b**2
+    cov = gaussian_filter(a * b, sigma) - mu_a * mu_b
+    ssim_map = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / ((mu_a**2 + mu_b**2 + c1) * (var_a + var_b + c2))
+    return float(ssim_map.mean())
+
+def reference_path(scene_name, t):
+    return REFERENCE_DIR / f"{scene_name}_{t:07.2f}s.png"
+
+def render_key_frames(module, scene_name, times):
+    random.seed(0)
+    np.random.seed(0)
+    return render_frames(getattr(module, scene_name), times)
+
+def run(module_path, scenes=None, update=False):
+    """Render every key frame at low resolution and compare it against its
+    stored reference; returns ``(scene, t, hash_distance, ssim)`` for each
+    drifted frame, with ``None`` scores when the reference is missing, or
+    writes fresh references when ``update`` is set."""
+    drifted = []
+    with tempconfig({"pixel_width": RESOLUTION[0], "pixel_height": RESOLUTION[1], "progress_bar": "none"}):
+        module = load_scene_module(module_path)
+        for scene_name in scenes or KEY_FRAMES:
+            frames = render_key_frames(module, scene_name, KEY_FRAMES[scene_name])
+            for t, frame in sorted(frames.items()):
+                path = reference_path(scene_name, t)
+                if update:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    Image.fromarray(frame).save(path)
+                    continue
+                if not path.exists():
+                    drifted.append((scene_name, t, None, None))
+                    continue
+                reference = np.asarray(Image.open(path).convert("RGBA"))
+                distance = int(np.count_nonzero(perceptual_hash(frame) != perceptual_hash(reference)))
+                similarity = ssim(frame, reference)
+                if distance > MAX_HASH_DISTANCE or similarity < MIN_SSIM:
+                    drifted.append((scene_name, t, distance, similarity))
+    return drifted
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Low-resolution perceptual regression check of key frames.")
+    parser.add_argument("file", nargs="?", default="video.py")
+    parser.add_argument("--scene", action="append", help="limit to these scene classes")
+    parser.add_argument("--update", action="store_true", help="overwrite the stored reference frames")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    drifted = run(args.file, args.scene, args.update)
+    for scene_name, t, distance, similarity in drifted:
+        if distance is None:
+            print(f"MISSING {scene_name} @ {t:.2f}s: no reference frame (run with --update)")
+        else:
+            print(f"DRIFT {scene_name} @ {t:.2f}s: phash distance {distance}, SSIM {similarity:.4f}")
+    print(f"{len(drifted)} drifted key frames ({time.perf_counter() - start:.1f}s)")
+    sys.exit(1 if drifted else 0)
@@ -0,0 +1,97 @@
+import argparse
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from manim import tempconfig
+from render_cache import SceneFingerprinter, concat_segments, load_scene_module, project_imports, section_classes
+
+PREVIEW_DIR = os.path.join("media", "preview")
+PREVIEW_CONFIG = {"pixel_width": 854, "pixel_height": 480, "frame_rate": 15, "disable_caching": False, "preview": False}
+
+def source_mtimes(project_dir):
+    return {path: path.stat().st_mtime for path in Path(project_dir).glob("*.py")}
+
+def reload_project(module_path, changed_files):
+    """Drop the changed project modules and every project module importing them
+    (directly or transitively) from ``sys.modules`` and re-execute the scene
+    module; manim, numpy and unaffected helpers stay imported."""
+    project_dir = Path(module_path).resolve().parent
+    changed = {Path(p).resolve() for p in changed_files}
+    stale = {
+        name: module for name, module in sys.modules.items()
+        if name != "__main__" and getattr(module, "__file__", None) and Path(module.__file__).resolve() in changed
+    }
+    project_modules = {
+        name: module for name, module in sys.modules.items()
+        if name != "__main__" and getattr(module, "__file__", None) and Path(module.__file__).resolve().parent == project_dir
+    }
+    while True:
+        importers = {
+            name: module for name, module in project_modules.items()
+            if name not in stale and any(dependency in stale.values() for dependency in project_imports(module, project_dir))
+        }
+        if not importers:
+            break
+        stale.update(importers)
+    for name in stale:
+        del sys.modules[name]
+    return load_scene_module(module_path)
+
+def render_preview_section(module_path, section):
+    """Render one section in-process at preview quality. Manim's per-play hash
+    cache re-encodes only the plays whose animations or mobjects changed;
+    returns the movie path and the indices of those plays."""
+    started = time.time()
+    overrides = {**PREVIEW_CONFIG, "input_file": str(module_path), "output_file": f"{section.__name__}_preview"}
+    with tempconfig(overrides):
+        scene = section(random_seed=0)
+        scene.render()
+        file_writer = scene.renderer.file_writer
+        changed_plays = [
+            index for index, path in enumerate(file_writer.partial_movie_files)
+            if path and os.path.getmtime(path) >= started
+        ]
+        return Path(file_writer.movie_file_path), changed_plays
+
+def watch(module_path, scene_name="FullVideo", poll_s=0.5):
+    module_path = Path(module_path).resolve()
+    project_dir = module_path.parent
+    mtimes, fingerprints, movies = {}, {}, {}
+    while True:
+        current = source_mtimes(project_dir)
+        changed_files = [path for path, mtime in current.items() if mtimes.get(path) != mtime]
+        if not changed_files:
+            time.sleep(poll_s)
+            continue
+        mtimes = current
+        started = time.perf_counter()
+        try:
+            module = reload_project(module_path, changed_files)
+            fingerprinter = SceneFingerprinter(project_dir)
+            for section in section_classes(getattr(module, scene_name)):
+                fingerprint = fingerprinter.fingerprint_scene(section)
+                if fingerprints.get(section.__name__) == fingerprint and movies.get(section.__name__, Path()).exists():
+                    continue
+                movies[section.__name__], changed_plays = render_preview_section(module_path, section)
+                fingerprints[section.__name__] = fingerprint
+                print(f"{section.__name__}: re-rendered plays {changed_plays or 'none'}")
+            sections = [section.__name__ for section in section_classes(getattr(module, scene_name))]
+            preview = concat_segments([movies[name] for name in sections], Path(PREVIEW_DIR, f"{scene_name}.mp4"))
+            print(f"preview updated in {time.perf_counter() - started:.1f}s: {preview}")
+        except Exception:
+            traceback.print_exc()
+            print("waiting for the next change...")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hot-reload a scene module and re-render changed plays at preview quality.")
+    parser.add_argument("file", nargs="?", default="video.py")
+    parser.add_argument("scene", nargs="?", default="FullVideo")
+    parser.add_argument("--poll", type=float, default=0.5, help="seconds between source checks")
+    args = parser.parse_args()
+    try:
+        watch(args.file, args.scene, args.poll)
+    except KeyboardInterrupt:
+        pass